@@ -0,0 +1,49 @@
+from .colony import AntColony, AntColonySystem, MaxMinAntSystem
+from .engine import SOLVERS, create_solver, solve
+from .genetic import GeneticAlgorithm
+from .islands import IslandModel
+from .instance import (
+    Instance,
+    load_cities,
+    load_instance,
+    load_tour,
+    load_tsplib,
+    save_cities,
+    save_instance,
+)
+from .local_search import MultiStartLocalSearch
+from .parallel_colony import ParallelAntColony, ParallelMaxMinAntSystem
+from .portfolio import Portfolio
+from .profiling import Stats
+from .progress import JsonlSink, Progress
+from .result import SolveResult, load_solution, save_solution
+from .termination import Termination
+
+__all__ = [
+    "AntColony",
+    "AntColonySystem",
+    "GeneticAlgorithm",
+    "Instance",
+    "IslandModel",
+    "JsonlSink",
+    "MaxMinAntSystem",
+    "MultiStartLocalSearch",
+    "ParallelAntColony",
+    "ParallelMaxMinAntSystem",
+    "Portfolio",
+    "Progress",
+    "SOLVERS",
+    "SolveResult",
+    "Stats",
+    "Termination",
+    "create_solver",
+    "load_cities",
+    "load_instance",
+    "load_solution",
+    "load_tour",
+    "load_tsplib",
+    "save_cities",
+    "save_instance",
+    "save_solution",
+    "solve",
+]
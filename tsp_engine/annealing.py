@@ -0,0 +1,288 @@
+import math
+import time
+
+import numpy as np
+
+
+class GeometricSchedule:
+    def __init__(self, rate, initial_temperature):
+        self.rate = rate
+
+    def update(self, temperature, acceptance, improved, progress):
+        return temperature * self.rate
+
+
+class AdaptiveSchedule:
+    def __init__(
+        self, rate, initial_temperature, initial_acceptance=0.5, window=1, horizon=1
+    ):
+        self.rate = rate
+        self.initial_acceptance = initial_acceptance
+        self.acceptance = initial_acceptance
+        self.window = window
+        self.horizon = horizon
+
+    def update(self, temperature, acceptance, improved, progress):
+        weight = min(1.0, self.window / self.horizon)
+        self.acceptance += weight * (acceptance - self.acceptance)
+        target = self.initial_acceptance * (1.0 - progress) ** 4
+        if self.acceptance > target:
+            return temperature * self.rate**weight
+        return temperature / self.rate**weight
+
+
+class ReheatingSchedule:
+    def __init__(
+        self,
+        rate,
+        initial_temperature,
+        patience=50,
+        reheat_factor=0.5,
+        min_temperature=1e-6,
+    ):
+        self.rate = rate
+        self.peak = initial_temperature
+        self.patience = patience
+        self.reheat_factor = reheat_factor
+        self.min_temperature = min_temperature
+        self.stalled = 0
+        self.reheats = 0
+
+    def update(self, temperature, acceptance, improved, progress):
+        self.stalled = 0 if improved else self.stalled + 1
+        temperature *= self.rate
+        if self.stalled >= self.patience or temperature <= self.min_temperature:
+            self.peak = max(self.peak * self.reheat_factor, 2 * self.min_temperature)
+            self.stalled = 0
+            self.reheats += 1
+            return self.peak
+        return temperature
+
+
+SCHEDULES = {
+    "geometric": GeometricSchedule,
+    "adaptive": AdaptiveSchedule,
+    "reheat": ReheatingSchedule,
+}
+
+MOVES = ("2opt", "swap", "insertion")
+
+DEFAULT_ANNEALING = {
+    "initial_temperature": 100.0,
+    "temperature_reduction_rate": 0.95,
+    "max_iterations": 100,
+}
+
+
+def anneal(
+    instance,
+    tour,
+    initial_temperature=None,
+    temperature_reduction_rate=0.95,
+    max_iterations=100,
+    schedule="geometric",
+    moves=MOVES,
+    steps_per_temperature=1,
+    time_limit=None,
+    min_temperature=1e-6,
+    rng=None,
+):
+    started = time.perf_counter()
+    stats = {
+        "moves_evaluated": 0,
+        "accepted": 0,
+        "improvements": 0,
+        "initial_temperature": initial_temperature,
+        "final_temperature": initial_temperature,
+        "time": 0.0,
+    }
+    n = len(tour)
+    if n < 4:
+        stats["time"] = time.perf_counter() - started
+        return np.array(tour), instance.tour_length(tour), stats
+    if schedule not in SCHEDULES:
+        raise ValueError(
+            f"Unknown cooling schedule '{schedule}', expected one of {sorted(SCHEDULES)}."
+        )
+    unknown = set(moves) - set(MOVES)
+    if unknown or not moves:
+        raise ValueError(f"Unknown annealing moves {sorted(unknown)}.")
+    rng = rng if rng is not None else np.random.default_rng()
+
+    d = instance.matrix.values.item
+    dtype = np.asarray(tour).dtype
+    tour = np.asarray(tour).tolist()
+
+    def two_opt_delta(p, q):
+        i, j = (p, q) if p < q else (q, p)
+        if i == 0 and j == n - 1:
+            return 0.0
+        a, b, c, e = tour[i - 1], tour[i], tour[j], tour[(j + 1) % n]
+        return d(a, c) + d(b, e) - d(a, b) - d(c, e)
+
+    def two_opt_apply(p, q):
+        i, j = (p, q) if p < q else (q, p)
+        if 2 * (j - i + 1) <= n:
+            tour[i : j + 1] = tour[i : j + 1][::-1]
+        else:
+            # reversing the complement gives the same cycle with fewer copies
+            outside = tour[j + 1 :] + tour[:i]
+            outside.reverse()
+            tour[j + 1 :] = outside[: n - j - 1]
+            tour[:i] = outside[n - j - 1 :]
+
+    def swap_delta(p, q):
+        i, j = (p, q) if p < q else (q, p)
+        if i == 0 and j == n - 1:
+            i, j = j, i
+        elif j - i != 1:
+            a, b, x = tour[i - 1], tour[i], tour[i + 1]
+            y, c, e = tour[j - 1], tour[j], tour[(j + 1) % n]
+            return (
+                d(a, c)
+                + d(c, x)
+                + d(y, b)
+                + d(b, e)
+                - d(a, b)
+                - d(b, x)
+                - d(y, c)
+                - d(c, e)
+            )
+        a, b, c, e = tour[i - 1], tour[i], tour[j], tour[(j + 1) % n]
+        return d(a, c) + d(b, e) - d(a, b) - d(c, e)
+
+    def swap_apply(p, q):
+        tour[p], tour[q] = tour[q], tour[p]
+
+    def insertion_delta(p, q):
+        if q == p - 1 or (p == 0 and q == n - 1):
+            return 0.0
+        a, b, x = tour[p - 1], tour[p], tour[(p + 1) % n]
+        c, e = tour[q], tour[(q + 1) % n]
+        return d(a, x) + d(c, b) + d(b, e) - d(a, b) - d(b, x) - d(c, e)
+
+    def insertion_apply(p, q):
+        # shifting a short arc beats list.pop/insert, which move the whole tail
+        city = tour[p]
+        if q > p and 16 * (q - p) <= n:
+            tour[p:q] = tour[p + 1 : q + 1]
+            tour[q] = city
+        elif q < p and 16 * (p - q) <= n:
+            tour[q + 2 : p + 1] = tour[q + 1 : p]
+            tour[q + 1] = city
+        else:
+            del tour[p]
+            tour.insert(q if q > p else q + 1, city)
+
+    kinds = {
+        "2opt": (two_opt_delta, two_opt_apply),
+        "swap": (swap_delta, swap_apply),
+        "insertion": (insertion_delta, insertion_apply),
+    }
+    move_table = [kinds[move] for move in moves]
+
+    def draw(size):
+        first = rng.integers(n, size=size)
+        second = rng.integers(n - 1, size=size)
+        second += second >= first
+        return (
+            rng.integers(len(move_table), size=size).tolist(),
+            first.tolist(),
+            second.tolist(),
+            rng.random(size).tolist(),
+        )
+
+    if initial_temperature is None:
+        chosen, first, second, _ = draw(min(1000, 10 * n))
+        deltas = [move_table[k][0](p, q) for k, p, q in zip(chosen, first, second)]
+        uphill = [delta for delta in deltas if delta > 0]
+        initial_temperature = (
+            -sum(uphill) / len(uphill) / math.log(0.5) if uphill else 1.0
+        )
+        stats["initial_temperature"] = initial_temperature
+    cooling = SCHEDULES[schedule](temperature_reduction_rate, initial_temperature)
+    if schedule == "reheat":
+        cooling.min_temperature = min_temperature
+    elif schedule == "adaptive":
+        cooling.window = max(1, int(steps_per_temperature))
+        cooling.horizon = max(1, min(n, max_iterations // 100))
+
+    current_distance = instance.tour_length(tour)
+    best_distance = current_distance
+    best_tour = None
+    temperature = initial_temperature
+    steps_per_temperature = max(1, int(steps_per_temperature))
+    deadline = started + time_limit if time_limit is not None else None
+    window_steps = window_accepted = 0
+    window_improved = False
+    done = 0
+    stopped = False
+
+    while done < max_iterations and not stopped:
+        size = min(1 << 16, max_iterations - done)
+        chosen, first, second, uniforms = draw(size)
+        for k in range(size):
+            if temperature <= min_temperature:
+                stopped = True
+                break
+            if deadline is not None and not k & 1023:
+                if time.perf_counter() >= deadline:
+                    stopped = True
+                    break
+            delta_fn, apply_fn = move_table[chosen[k]]
+            p, q = first[k], second[k]
+            delta = delta_fn(p, q)
+            done += 1
+            if delta < 0 or uniforms[k] < math.exp(-delta / temperature):
+                if delta > 0 and best_tour is None:
+                    best_tour = tour[:]
+                apply_fn(p, q)
+                current_distance += delta
+                window_accepted += 1
+                if current_distance < best_distance - 1e-9:
+                    best_distance = current_distance
+                    best_tour = None
+                    window_improved = True
+                    stats["improvements"] += 1
+
+            window_steps += 1
+            if window_steps == steps_per_temperature:
+                temperature = cooling.update(
+                    temperature,
+                    window_accepted / window_steps,
+                    window_improved,
+                    done / max_iterations,
+                )
+                stats["accepted"] += window_accepted
+                window_steps = window_accepted = 0
+                window_improved = False
+
+    stats["accepted"] += window_accepted
+    stats["moves_evaluated"] = done
+    stats["final_temperature"] = temperature
+    if best_tour is None:
+        best_tour = tour
+    best_tour = np.array(best_tour, dtype=dtype)
+    stats["time"] = time.perf_counter() - started
+    return best_tour, instance.tour_length(best_tour), stats
+
+
+def simulated_annealing(
+    instance,
+    tour,
+    initial_temperature=None,
+    temperature_reduction_rate=0.95,
+    max_iterations=100,
+    rng=None,
+    **options,
+):
+    best_tour, best_distance, _ = anneal(
+        instance,
+        tour,
+        initial_temperature,
+        temperature_reduction_rate,
+        max_iterations,
+        rng=rng,
+        **options,
+    )
+    return best_tour, best_distance
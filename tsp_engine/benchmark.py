@@ -0,0 +1,276 @@
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+from .annealing import anneal
+from .colony import AntColony
+from .genetic import GeneticAlgorithm
+from .instance import Instance
+from .local_search import two_opt
+from .termination import Termination
+
+KINDS = ("uniform", "clustered", "grid")
+SIZES = (50, 200, 1000, 5000)
+ALGORITHMS = ("ga", "aco", "2opt", "sa")
+GAP_TARGETS = (0.10, 0.05, 0.02)
+ACO_MAX_CITIES = 2000
+SIDE = 1000.0
+
+
+def city_names(num_cities):
+    return [f"C{i}" for i in range(num_cities)]
+
+
+def uniform_instance(num_cities, rng):
+    return Instance(city_names(num_cities), rng.random((num_cities, 2)) * SIDE), None
+
+
+def clustered_instance(num_cities, rng):
+    num_clusters = max(1, num_cities // 100)
+    centers = rng.random((num_clusters, 2)) * SIDE
+    spread = SIDE / (4.0 * np.sqrt(num_clusters))
+    coords = centers[rng.integers(num_clusters, size=num_cities)]
+    coords += rng.normal(scale=spread, size=(num_cities, 2))
+    return Instance(city_names(num_cities), np.clip(coords, 0.0, SIDE)), None
+
+
+def grid_instance(num_cities, rng):
+    rows = max(d for d in range(1, int(np.sqrt(num_cities)) + 1) if num_cities % d == 0)
+    cols = num_cities // rows
+    spacing = SIDE / cols
+    ys, xs = np.divmod(np.arange(num_cities), cols)
+    coords = np.column_stack((xs, ys)) * spacing
+    if rows == 1:
+        optimum = 2.0 * spacing * (num_cities - 1)
+    elif num_cities % 2 == 0:
+        optimum = spacing * num_cities
+    else:
+        optimum = spacing * (num_cities - 1 + np.sqrt(2.0))
+    return Instance(city_names(num_cities), coords), float(optimum)
+
+
+GENERATORS = {
+    "uniform": uniform_instance,
+    "clustered": clustered_instance,
+    "grid": grid_instance,
+}
+
+
+def make_corpus(kinds=KINDS, sizes=SIZES, seed=0):
+    corpus = []
+    for kind in kinds:
+        for num_cities in sizes:
+            rng = np.random.default_rng([seed, KINDS.index(kind), num_cities])
+            instance, optimum = GENERATORS[kind](num_cities, rng)
+            corpus.append((f"{kind}-{num_cities}", kind, instance, optimum))
+    return corpus
+
+
+def run_solver(solver):
+    started = time.perf_counter()
+    trace = []
+    while not solver.done:
+        solver.step()
+        trace.append((time.perf_counter() - started, float(solver.best()[1])))
+    result = solver.finish()
+    elapsed = time.perf_counter() - started
+    trace.append((elapsed, float(result.distance)))
+    return result.distance, elapsed, solver.termination.evaluations, trace
+
+
+def run_algorithm(algorithm, instance, seed, time_limit):
+    rng = np.random.default_rng(seed)
+    if algorithm == "ga":
+        solver = GeneticAlgorithm(
+            instance, generations=200, termination=Termination(time_limit), seed=rng
+        )
+        return (*run_solver(solver), "tours")
+    if algorithm == "aco":
+        solver = AntColony(
+            instance, iterations=100, termination=Termination(time_limit), seed=rng
+        )
+        return (*run_solver(solver), "tours")
+
+    tour = rng.permutation(len(instance))
+    if algorithm == "2opt":
+        _, distance, stats = two_opt(instance, tour, time_limit=time_limit)
+    elif algorithm == "sa":
+        _, distance, stats = anneal(
+            instance,
+            tour,
+            max_iterations=100 * len(instance),
+            steps_per_temperature=len(instance),
+            time_limit=time_limit,
+            rng=rng,
+        )
+    else:
+        raise ValueError(f"Unknown benchmark algorithm '{algorithm}'.")
+    trace = [(stats["time"], float(distance))]
+    return distance, stats["time"], stats["moves_evaluated"], trace, "moves"
+
+
+def time_to_gap(trace, reference, targets=GAP_TARGETS):
+    reached = {}
+    for target in targets:
+        reached[f"{target:g}"] = next(
+            (t for t, best in trace if best <= reference * (1.0 + target) + 1e-9),
+            None,
+        )
+    return reached
+
+
+def run_benchmark(
+    kinds=KINDS,
+    sizes=SIZES,
+    algorithms=ALGORITHMS,
+    seed=0,
+    time_limit=60.0,
+    references=None,
+    log=None,
+):
+    references = references or {}
+    results = []
+    for name, kind, instance, optimum in make_corpus(kinds, sizes, seed):
+        started = time.perf_counter()
+        instance.matrix.values
+        setup = time.perf_counter() - started
+        runs = []
+        for algorithm in algorithms:
+            if algorithm == "aco" and len(instance) > ACO_MAX_CITIES:
+                continue
+            distance, elapsed, evaluations, trace, unit = run_algorithm(
+                algorithm, instance, seed, time_limit
+            )
+            runs.append(
+                {
+                    "instance": name,
+                    "kind": kind,
+                    "num_cities": len(instance),
+                    "algorithm": algorithm,
+                    "seed": seed,
+                    "matrix_time": setup,
+                    "time": elapsed,
+                    "evaluations": int(evaluations),
+                    "evaluation_unit": unit,
+                    "length": float(distance),
+                    "trace": trace,
+                }
+            )
+            if log is not None:
+                log(f"{name:>16} {algorithm:>5} {distance:14.2f} {elapsed:8.2f}s")
+
+        if name in references:
+            reference, reference_kind = float(references[name]), "given"
+        elif optimum is not None:
+            reference, reference_kind = optimum, "optimal"
+        else:
+            reference = min((run["length"] for run in runs), default=None)
+            reference_kind = "best_found"
+        for run in runs:
+            trace = run.pop("trace")
+            run["reference"] = reference
+            run["reference_kind"] = reference_kind
+            run["gap"] = run["length"] / reference - 1.0 if reference else None
+            run["time_to_gap"] = time_to_gap(trace, reference) if reference else {}
+        results.extend(runs)
+
+    return {
+        "config": {
+            "kinds": list(kinds),
+            "sizes": list(sizes),
+            "algorithms": list(algorithms),
+            "seed": seed,
+            "time_limit": time_limit,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+        },
+        "results": results,
+    }
+
+
+def compare_reports(baseline, report):
+    previous = {(r["instance"], r["algorithm"]): r for r in baseline["results"]}
+    rows = []
+    for run in report["results"]:
+        old = previous.get((run["instance"], run["algorithm"]))
+        if old is None:
+            continue
+        rows.append(
+            {
+                "instance": run["instance"],
+                "algorithm": run["algorithm"],
+                "length": run["length"],
+                "length_change": run["length"] / old["length"] - 1.0,
+                "time": run["time"],
+                "speedup": old["time"] / run["time"] if run["time"] > 0 else None,
+            }
+        )
+    return rows
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m tsp_engine.benchmark",
+        description="Run the fixed-seed benchmark corpus and write a JSON report.",
+    )
+    parser.add_argument("-o", "--output", help="write the JSON report to this file")
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=list(KINDS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument(
+        "--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS)
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--time-limit", type=float, default=60.0, help="seconds per algorithm run"
+    )
+    parser.add_argument(
+        "--references", help="JSON file mapping instance names to reference lengths"
+    )
+    parser.add_argument("--compare", help="baseline report to compare against")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        references = None
+        if args.references:
+            with open(args.references) as f:
+                references = json.load(f)
+        report = run_benchmark(
+            args.kinds,
+            args.sizes,
+            args.algorithms,
+            args.seed,
+            args.time_limit,
+            references,
+            log=print,
+        )
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=4)
+        if args.compare:
+            with open(args.compare) as f:
+                baseline = json.load(f)
+            for row in compare_reports(baseline, report):
+                speedup = f"{row['speedup']:.2f}x" if row["speedup"] else "n/a"
+                print(
+                    f"{row['instance']:>16} {row['algorithm']:>5} "
+                    f"{row['length_change']:+8.2%} {speedup:>8}"
+                )
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
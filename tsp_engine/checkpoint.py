@@ -0,0 +1,77 @@
+import json
+import os
+import time
+
+import numpy as np
+
+
+def split_arrays(state, prefix="", arrays=None):
+    arrays = {} if arrays is None else arrays
+    meta = {}
+    for key, value in state.items():
+        if isinstance(value, np.ndarray):
+            arrays[prefix + key] = value
+            meta[key] = {"array": prefix + key}
+        elif isinstance(value, dict):
+            meta[key] = {"state": split_arrays(value, f"{prefix}{key}.", arrays)[1]}
+        else:
+            meta[key] = {"value": value}
+    return arrays, meta
+
+
+def join_arrays(meta, arrays):
+    state = {}
+    for key, entry in meta.items():
+        if "array" in entry:
+            state[key] = arrays[entry["array"]]
+        elif "state" in entry:
+            state[key] = join_arrays(entry["state"], arrays)
+        else:
+            state[key] = entry["value"]
+    return state
+
+
+def save_checkpoint(solver, filepath):
+    if not hasattr(solver, "state"):
+        raise ValueError(f"'{solver.name}' does not support checkpoints.")
+    arrays, meta = split_arrays(solver.state())
+    header = {"algorithm": solver.name, "num_cities": len(solver.instance)}
+    temporary = f"{filepath}.tmp"
+    with open(temporary, "wb") as f:
+        np.savez(f, meta=np.array(json.dumps({**header, "state": meta})), **arrays)
+    os.replace(temporary, filepath)
+
+
+def load_checkpoint(solver, filepath):
+    if not hasattr(solver, "restore"):
+        raise ValueError(f"'{solver.name}' does not support checkpoints.")
+    with np.load(filepath) as data:
+        meta = json.loads(str(data["meta"]))
+        arrays = {key: data[key] for key in data.files if key != "meta"}
+    if meta["algorithm"] != solver.name:
+        raise ValueError(
+            f"Checkpoint {filepath} was written by '{meta['algorithm']}', not '{solver.name}'."
+        )
+    if meta["num_cities"] != len(solver.instance):
+        raise ValueError(
+            f"Checkpoint {filepath} has {meta['num_cities']} cities, the instance has {len(solver.instance)}."
+        )
+    solver.restore(join_arrays(meta["state"], arrays))
+    return solver
+
+
+class Checkpointer:
+    def __init__(self, filepath, interval=60.0):
+        self.filepath = filepath
+        self.interval = interval
+        self.last_saved = time.monotonic()
+        self.saves = 0
+
+    def update(self, solver):
+        if time.monotonic() - self.last_saved >= self.interval:
+            self.save(solver)
+
+    def save(self, solver):
+        save_checkpoint(solver, self.filepath)
+        self.last_saved = time.monotonic()
+        self.saves += 1
@@ -0,0 +1,379 @@
+import argparse
+import json
+import sys
+
+from .annealing import MOVES, SCHEDULES
+from .distance import DTYPES
+from .construction import CONSTRUCTIONS
+from .engine import SOLVERS, solve
+from .genetic import MUTATIONS
+from .instance import CANDIDATES, load_instance, load_tour, save_instance
+from .islands import TOPOLOGIES
+from .local_search import LOCAL_SEARCH
+from .portfolio import MEMBERS
+from .profiling import Stats
+from .progress import JsonlSink, Progress
+from .result import save_solution
+from .termination import Termination
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m tsp_engine",
+        description="Solve a TSP instance without the GUI.",
+    )
+    parser.add_argument(
+        "instance",
+        help="JSON file mapping city names to [x, y], a TSPLIB .tsp or a binary .npz file",
+    )
+    parser.add_argument("-a", "--algorithm", choices=sorted(SOLVERS), default="ga")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--dtype",
+        choices=sorted(DTYPES),
+        default="float64",
+        help="precision of the distance matrix",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="write the result to this file (.npz for binary, JSON otherwise)",
+    )
+    parser.add_argument(
+        "--save-instance", help="also write the instance to this binary .npz file"
+    )
+    parser.add_argument(
+        "--save-matrix",
+        action="store_true",
+        help="store the distance matrix next to --save-instance for memory mapping",
+    )
+    parser.add_argument(
+        "--initialization",
+        choices=["random", *sorted(CONSTRUCTIONS)],
+        default="random",
+        help="GA: seed part of the population with this construction heuristic; "
+        "ACO: start the pheromone and best tour from it",
+    )
+    parser.add_argument(
+        "--optimal-tour", help="TSPLIB .opt.tour file to report the optimality gap"
+    )
+
+    ga = parser.add_argument_group("genetic algorithm")
+    ga.add_argument("--population-size", type=int, default=100)
+    ga.add_argument("--generations", type=int, default=150)
+    ga.add_argument("--mutation-rate", type=float, default=0.2)
+    ga.add_argument("--mutation", choices=sorted(MUTATIONS), default="swap")
+    ga.add_argument("--tournament-size", type=int, default=5)
+    ga.add_argument(
+        "--heuristic-fraction",
+        type=float,
+        default=0.1,
+        help="share of the population built by --initialization",
+    )
+    ga.add_argument(
+        "--local-search",
+        choices=sorted(LOCAL_SEARCH),
+        default="2opt",
+        help="post-optimization applied to the best GA tour",
+    )
+
+    islands = parser.add_argument_group("island model (--algorithm islands)")
+    islands.add_argument(
+        "--islands", type=int, default=None, help="worker processes (default: CPUs)"
+    )
+    islands.add_argument("--migration-interval", type=int, default=10)
+    islands.add_argument("--migrants", type=int, default=2)
+    islands.add_argument("--topology", choices=TOPOLOGIES, default="ring")
+
+    sa = parser.add_argument_group("simulated annealing (after GA local search)")
+    sa.add_argument("--sa-iterations", type=int, default=100)
+    sa.add_argument(
+        "--sa-temperature",
+        type=float,
+        default=100.0,
+        help="initial temperature, 0 to estimate it from sampled moves",
+    )
+    sa.add_argument("--sa-cooling", type=float, default=0.95)
+    sa.add_argument("--sa-schedule", choices=sorted(SCHEDULES), default="geometric")
+    sa.add_argument(
+        "--sa-moves",
+        nargs="+",
+        choices=MOVES,
+        default=list(MOVES),
+    )
+    sa.add_argument(
+        "--sa-steps-per-temperature",
+        type=int,
+        default=1,
+        help="moves between two temperature updates",
+    )
+    sa.add_argument("--sa-time-limit", type=float, default=None)
+
+    aco = parser.add_argument_group("ant colony optimization")
+    aco.add_argument("--num-ants", type=int, default=50)
+    aco.add_argument("--iterations", type=int, default=100)
+    aco.add_argument("--pheromone-init", type=float, default=0.1)
+    aco.add_argument("--evaporation-rate", type=float, default=0.1)
+    aco.add_argument("--alpha", type=float, default=1.0)
+    aco.add_argument("--beta", type=float, default=2.0)
+    aco.add_argument(
+        "--p-best",
+        type=float,
+        default=0.05,
+        help="MAX-MIN: probability of rebuilding the best tour at convergence",
+    )
+    aco.add_argument(
+        "--q0",
+        type=float,
+        default=0.9,
+        help="ACS: probability of taking the best edge instead of sampling",
+    )
+    aco.add_argument("--local-evaporation", type=float, default=0.1)
+    aco.add_argument(
+        "--candidates",
+        type=int,
+        default=None,
+        help="let ants choose among this many candidate cities (default: all)",
+    )
+    aco.add_argument("--candidate-type", choices=CANDIDATES, default="nearest")
+    aco.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="processes building ants for the *-parallel variants (default: CPUs)",
+    )
+
+    checkpoints = parser.add_argument_group(
+        "checkpoints (ga, aco, mmas, acs, multistart)"
+    )
+    checkpoints.add_argument(
+        "--checkpoint", help="periodically save the run state here"
+    )
+    checkpoints.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        default=60.0,
+        help="seconds between two checkpoints",
+    )
+    checkpoints.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue from --checkpoint if it exists (use the same parameters)",
+    )
+
+    multistart = parser.add_argument_group("multi-start local search")
+    multistart.add_argument("--restarts", type=int, default=20)
+
+    stopping = parser.add_argument_group(
+        "stopping criteria (whichever is reached first)"
+    )
+    stopping.add_argument(
+        "--time-limit",
+        type=float,
+        default=None,
+        help="wall-clock budget in seconds (portfolio default: 10)",
+    )
+    stopping.add_argument(
+        "--stall-limit",
+        type=int,
+        default=None,
+        help="stop after this many generations/iterations without improvement",
+    )
+    stopping.add_argument("--target-distance", type=float, default=None)
+    stopping.add_argument(
+        "--max-evaluations",
+        type=int,
+        default=None,
+        help="budget of distance evaluations (n per complete tour)",
+    )
+
+    portfolio = parser.add_argument_group("portfolio (--algorithm portfolio)")
+    portfolio.add_argument(
+        "--members",
+        nargs="+",
+        choices=sorted(MEMBERS),
+        default=["ga", "aco", "multistart"],
+    )
+
+    profiling = parser.add_argument_group("profiling (all but portfolio)")
+    profiling.add_argument(
+        "--profile",
+        action="store_true",
+        help="print time per phase and evaluation counters to stderr",
+    )
+    profiling.add_argument(
+        "--profile-output",
+        help="write the phase timings and counters to this JSON file",
+    )
+
+    progress = parser.add_argument_group("progress events")
+    progress.add_argument(
+        "--progress", help="write progress events to this JSON Lines file"
+    )
+    progress.add_argument(
+        "--progress-every",
+        type=int,
+        default=1,
+        help="report one iteration event every N generations/iterations",
+    )
+    progress.add_argument(
+        "--progress-interval",
+        type=float,
+        default=0.0,
+        help="minimum seconds between two iteration events",
+    )
+    progress.add_argument(
+        "--progress-tours",
+        action="store_true",
+        help="include the tour in best_improved and run_finished events",
+    )
+    return parser
+
+
+def solver_params(args):
+    params = algorithm_params(args)
+    criteria = (
+        args.time_limit,
+        args.stall_limit,
+        args.target_distance,
+        args.max_evaluations,
+    )
+    if args.algorithm != "portfolio" and any(c is not None for c in criteria):
+        params["termination"] = Termination(
+            time_limit=args.time_limit,
+            stall_limit=args.stall_limit,
+            target_distance=args.target_distance,
+            max_evaluations=args.max_evaluations,
+        )
+    if args.algorithm != "portfolio" and (args.profile or args.profile_output):
+        params["stats"] = Stats()
+    return params
+
+
+def algorithm_params(args):
+    if args.algorithm == "portfolio":
+        time_limit = args.time_limit
+        if time_limit is None and args.max_evaluations is None:
+            time_limit = 10.0
+        return {
+            "time_limit": time_limit,
+            "max_evaluations": args.max_evaluations,
+            "target_distance": args.target_distance,
+            "members": args.members,
+            "member_params": {
+                member: {
+                    key: value
+                    for key, value in algorithm_params(
+                        argparse.Namespace(**{**vars(args), "algorithm": member})
+                    ).items()
+                    if key not in ("seed", "generations", "iterations", "restarts")
+                }
+                for member in args.members
+            },
+            "seed": args.seed,
+        }
+    if args.algorithm == "multistart":
+        return {
+            "restarts": args.restarts,
+            "method": args.local_search,
+            "seed": args.seed,
+        }
+    if args.algorithm in ("ga", "islands"):
+        params = {
+            "population_size": args.population_size,
+            "generations": args.generations,
+            "mutation_rate": args.mutation_rate,
+            "mutation": args.mutation,
+            "tournament_size": args.tournament_size,
+            "initialization": args.initialization,
+            "heuristic_fraction": args.heuristic_fraction,
+            "local_search": args.local_search,
+            "annealing": {
+                "initial_temperature": args.sa_temperature or None,
+                "temperature_reduction_rate": args.sa_cooling,
+                "max_iterations": args.sa_iterations,
+                "schedule": args.sa_schedule,
+                "moves": tuple(args.sa_moves),
+                "steps_per_temperature": args.sa_steps_per_temperature,
+                "time_limit": args.sa_time_limit,
+            },
+            "seed": args.seed,
+        }
+        if args.algorithm == "islands":
+            params["num_islands"] = args.islands
+            params["migration_interval"] = args.migration_interval
+            params["num_migrants"] = args.migrants
+            params["topology"] = args.topology
+        return params
+
+    params = {
+        "num_ants": args.num_ants,
+        "iterations": args.iterations,
+        "pheromone_init": args.pheromone_init,
+        "evaporation_rate": args.evaporation_rate,
+        "alpha": args.alpha,
+        "beta": args.beta,
+        "num_candidates": args.candidates,
+        "candidate_type": args.candidate_type,
+        "initialization": args.initialization,
+        "seed": args.seed,
+    }
+    if args.algorithm.endswith("-parallel"):
+        params["num_workers"] = args.workers
+    if args.algorithm.startswith("mmas"):
+        params["p_best"] = args.p_best
+    elif args.algorithm == "acs":
+        params["exploitation"] = args.q0
+        params["local_evaporation"] = args.local_evaporation
+    return params
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        instance = load_instance(args.instance, DTYPES[args.dtype])
+        optimal_tour = args.optimal_tour and load_tour(args.optimal_tour, instance)
+        params = solver_params(args)
+        progress = args.progress and Progress(
+            JsonlSink(args.progress),
+            every=args.progress_every,
+            interval=args.progress_interval,
+            include_tours=args.progress_tours,
+        )
+        try:
+            result = solve(
+                instance,
+                args.algorithm,
+                checkpoint=args.checkpoint,
+                checkpoint_interval=args.checkpoint_interval,
+                resume=args.resume,
+                progress=progress,
+                **params,
+            )
+        finally:
+            if progress:
+                progress.close()
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Best Tour: {'-'.join(result.tour_names)}")
+    print(f"Distance: {result.distance:.2f}")
+    if result.stop_reason:
+        print(f"Stopped: {result.stop_reason}")
+    if args.optimal_tour:
+        optimum = instance.tour_length(optimal_tour)
+        print(f"Gap: {100.0 * (result.distance / optimum - 1.0):.2f}%")
+    if args.output and args.output.lower().endswith(".npz"):
+        save_solution(result, args.output)
+    elif args.output:
+        with open(args.output, "w") as f:
+            json.dump(result.to_dict(), f, indent=4)
+    if args.save_instance:
+        save_instance(instance, args.save_instance, args.save_matrix)
+    stats = params.get("stats")
+    if stats and args.profile:
+        print(stats.report(), file=sys.stderr)
+    if stats and args.profile_output:
+        stats.dump(args.profile_output)
+    return 0
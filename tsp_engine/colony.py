@@ -0,0 +1,430 @@
+import numpy as np
+
+from .construction import construct_tour
+from .population import index_dtype
+from .profiling import NO_STATS
+from .result import SolveResult
+from .termination import Termination
+
+
+def initialize_pheromone(num_cities, pheromone_init_val):
+    return np.full((num_cities, num_cities), pheromone_init_val, dtype=float)
+
+
+def evaporate_pheromone(pheromone, evaporation_rate_val):
+    if pheromone.size > 0:
+        pheromone *= 1.0 - evaporation_rate_val
+
+
+def heuristic_matrix(distances, beta_val):
+    distances = np.where(distances == 0, 1e-6, distances).astype(np.float64)
+    eta_beta = (1.0 / distances) ** beta_val
+    np.fill_diagonal(eta_beta, 0.0)
+    return eta_beta
+
+
+def construct_tours(
+    pheromone,
+    eta_beta,
+    alpha_val,
+    num_ants,
+    rng,
+    exploitation=0.0,
+    local_update=None,
+    candidates=None,
+):
+    if candidates is not None and candidates.shape[1] > 0:
+        return construct_candidate_tours(
+            pheromone,
+            eta_beta,
+            alpha_val,
+            num_ants,
+            rng,
+            candidates,
+            exploitation,
+            local_update,
+        )
+
+    num_cities = len(pheromone)
+    block = max(1, int(np.ceil(np.sqrt(num_cities))))
+    num_blocks = -(-num_cities // block)
+    width = num_blocks * block
+
+    weights = np.zeros((num_cities, width))
+    weights[:, :num_cities] = pheromone**alpha_val * eta_beta
+    tours = np.empty((num_ants, num_cities), dtype=index_dtype(num_cities))
+    ants = np.arange(num_ants)
+    current = rng.integers(num_cities, size=num_ants)
+    tours[:, 0] = current
+    unvisited = np.zeros((num_ants, width))
+    unvisited[:, :num_cities] = 1.0
+    unvisited[ants, current] = 0.0
+
+    ones = np.ones(block)
+
+    for step in range(1, num_cities):
+        candidates = weights[current]
+        candidates *= unvisited
+        blocks = candidates.reshape(num_ants, num_blocks, block)
+        # one matrix-vector product is several times faster than sum(axis=2)
+        block_sums = (candidates.reshape(-1, block) @ ones).reshape(num_ants, -1)
+        stuck = ~(block_sums.sum(axis=1) > 0)
+        if stuck.any():
+            candidates[stuck] = unvisited[stuck]
+            block_sums[stuck] = blocks[stuck].sum(axis=2)
+
+        cumulative = np.cumsum(block_sums, axis=1)
+        threshold = rng.random(num_ants) * cumulative[:, -1]
+        chosen_block = (cumulative <= threshold[:, None]).sum(axis=1)
+        np.minimum(chosen_block, num_blocks - 1, out=chosen_block)
+        threshold -= cumulative[ants, chosen_block] - block_sums[ants, chosen_block]
+
+        inner = np.cumsum(blocks[ants, chosen_block], axis=1)
+        offset = (inner <= threshold[:, None]).sum(axis=1)
+        np.minimum(offset, block - 1, out=offset)
+        next_city = chosen_block * block + offset
+
+        invalid = ~(candidates[ants, next_city] > 0)
+        if exploitation > 0:
+            invalid |= rng.random(num_ants) < exploitation
+        if invalid.any():
+            next_city[invalid] = np.argmax(candidates[invalid], axis=1)
+
+        tours[:, step] = next_city
+        unvisited[ants, next_city] = 0.0
+        if local_update is not None:
+            update_edges(
+                pheromone,
+                weights,
+                eta_beta,
+                alpha_val,
+                current,
+                next_city,
+                local_update,
+            )
+        current = next_city
+
+    if local_update is not None:
+        update_edges(
+            pheromone, weights, eta_beta, alpha_val, current, tours[:, 0], local_update
+        )
+
+    return tours
+
+
+def construct_candidate_tours(
+    pheromone,
+    eta_beta,
+    alpha_val,
+    num_ants,
+    rng,
+    candidates,
+    exploitation=0.0,
+    local_update=None,
+):
+    num_cities = len(pheromone)
+    num_candidates = candidates.shape[1]
+    tours = np.empty((num_ants, num_cities), dtype=index_dtype(num_cities))
+    ants = np.arange(num_ants)
+    current = rng.integers(num_cities, size=num_ants)
+    tours[:, 0] = current
+    visited = np.zeros((num_ants, num_cities), dtype=bool)
+    visited[ants, current] = True
+
+    for step in range(1, num_cities):
+        options = candidates[current]
+        rows = current[:, None]
+        weights = pheromone[rows, options] ** alpha_val * eta_beta[rows, options]
+        weights[visited[ants[:, None], options]] = 0.0
+
+        cumulative = np.cumsum(weights, axis=1)
+        threshold = rng.random(num_ants) * cumulative[:, -1]
+        choice = (cumulative <= threshold[:, None]).sum(axis=1)
+        np.minimum(choice, num_candidates - 1, out=choice)
+        if exploitation > 0:
+            greedy = rng.random(num_ants) < exploitation
+            choice[greedy] = np.argmax(weights[greedy], axis=1)
+        next_city = options[ants, choice]
+
+        stuck = ~(weights[ants, choice] > 0)
+        if stuck.any():
+            best = pheromone[current[stuck]] ** alpha_val * eta_beta[current[stuck]]
+            best[visited[stuck]] = -1.0
+            next_city[stuck] = np.argmax(best, axis=1)
+
+        tours[:, step] = next_city
+        visited[ants, next_city] = True
+        if local_update is not None:
+            update_trails(pheromone, current, next_city, local_update)
+        current = next_city
+
+    if local_update is not None:
+        update_trails(pheromone, current, tours[:, 0], local_update)
+
+    return tours
+
+
+def update_trails(pheromone, src, dst, local_update):
+    local_evaporation, tau0 = local_update
+    trail = (1.0 - local_evaporation) * pheromone[src, dst] + local_evaporation * tau0
+    pheromone[src, dst] = pheromone[dst, src] = trail
+    return trail
+
+
+def update_edges(pheromone, weights, eta_beta, alpha_val, src, dst, local_update):
+    trail = update_trails(pheromone, src, dst, local_update)
+    weights[src, dst] = trail**alpha_val * eta_beta[src, dst]
+    weights[dst, src] = trail**alpha_val * eta_beta[dst, src]
+
+
+def tour_edges(tours):
+    tours = np.atleast_2d(tours)
+    return tours.ravel(), np.roll(tours, -1, axis=1).ravel()
+
+
+def deposit_pheromone(pheromone, tours, lengths):
+    tours = np.atleast_2d(tours)
+    lengths = np.atleast_1d(np.asarray(lengths, dtype=np.float64))
+    valid = lengths > 0
+    if not valid.all():
+        tours, lengths = tours[valid], lengths[valid]
+    src, dst = tour_edges(tours)
+    amounts = np.repeat(1.0 / lengths, tours.shape[1])
+    np.add.at(pheromone, (src, dst), amounts)
+    np.add.at(pheromone, (dst, src), amounts)
+
+
+class AntColony:
+    name = "aco"
+
+    def __init__(
+        self,
+        instance,
+        num_ants=50,
+        iterations=100,
+        pheromone_init=0.1,
+        evaporation_rate=0.1,
+        alpha=1.0,
+        beta=2.0,
+        num_candidates=None,
+        candidate_type="nearest",
+        initialization="random",
+        termination=None,
+        stats=None,
+        seed=None,
+    ):
+        if len(instance) < 2:
+            raise ValueError("Please add at least 2 cities for ACO.")
+        if num_ants < 1:
+            raise ValueError("ACO needs at least one ant.")
+        self.instance = instance
+        self.num_ants = num_ants
+        self.iterations = iterations
+        self.evaporation_rate = evaporation_rate
+        self.alpha = alpha
+        self.beta = beta
+        self.rng = np.random.default_rng(seed)
+        self.termination = termination or Termination()
+        self.termination.start()
+        self.stats = stats or NO_STATS
+
+        self.pheromone = initialize_pheromone(len(instance), pheromone_init)
+        self.eta_beta = heuristic_matrix(instance.matrix.values, beta)
+        self.candidates = None
+        if num_candidates:
+            self.candidates = instance.candidates(num_candidates, candidate_type)
+        self.iteration = 0
+        self.best_distances = []
+        self.best_tour = np.array([], dtype=int)
+        self.best_distance = float("inf")
+        if initialization != "random":
+            self.best_tour = construct_tour(instance, initialization, self.rng)
+            self.best_distance = instance.tour_length(self.best_tour)
+            self.pheromone.fill(num_ants / self.best_distance)
+
+    @property
+    def done(self):
+        return self.iteration >= self.iterations or self.termination.reached
+
+    def construct(self):
+        with self.stats.phase("construction"):
+            tours = construct_tours(
+                self.pheromone,
+                self.eta_beta,
+                self.alpha,
+                self.num_ants,
+                self.rng,
+                candidates=self.candidates,
+            )
+        with self.stats.phase("evaluation"):
+            return tours, self.instance.tour_lengths(tours)
+
+    def update_pheromone(self, tours, lengths, iter_best):
+        evaporate_pheromone(self.pheromone, self.evaporation_rate)
+        deposit_pheromone(self.pheromone, tours, lengths)
+
+    def step(self):
+        ants_tours, lengths = self.construct()
+        iter_best = int(np.argmin(lengths))
+        iter_best_tour = ants_tours[iter_best].copy()
+        iter_best_distance = float(lengths[iter_best])
+
+        if iter_best_distance < self.best_distance:
+            self.best_tour = iter_best_tour
+            self.best_distance = iter_best_distance
+
+        with self.stats.phase("pheromone_update"):
+            self.update_pheromone(ants_tours, lengths, iter_best)
+        self.stats.count_tours(len(ants_tours), len(self.instance))
+
+        self.termination.record(self.best_distance, self.num_ants * len(self.instance))
+        self.best_distances.append(self.best_distance)
+        self.iteration += 1
+        return iter_best_tour, iter_best_distance
+
+    def best(self):
+        return self.best_tour, self.best_distance
+
+    def adopt(self, tour, distance):
+        if distance < self.best_distance:
+            self.best_tour, self.best_distance = np.array(tour), distance
+
+    def state(self):
+        return {
+            "pheromone": self.pheromone,
+            "best_tour": self.best_tour,
+            "best_distance": self.best_distance,
+            "iteration": self.iteration,
+            "best_distances": self.best_distances,
+            "rng": self.rng.bit_generator.state,
+            "termination": self.termination.state(),
+        }
+
+    def restore(self, state):
+        self.pheromone[:] = state["pheromone"]
+        self.best_tour = state["best_tour"]
+        self.best_distance = state["best_distance"]
+        self.iteration = state["iteration"]
+        self.best_distances[:] = state["best_distances"]
+        self.rng.bit_generator.state = state["rng"]
+        self.termination.restore(state["termination"])
+
+    def finish(self):
+        return SolveResult(
+            self.instance,
+            self.best_tour,
+            self.best_distance,
+            self.best_distances,
+            self.name,
+            self.termination.reason,
+        )
+
+    def run(self):
+        while not self.done:
+            self.step()
+        return self.finish()
+
+
+class MaxMinAntSystem(AntColony):
+    name = "mmas"
+
+    def __init__(self, instance, p_best=0.05, global_best_interval=5, **params):
+        super().__init__(instance, **params)
+        self.p_best = p_best
+        self.global_best_interval = global_best_interval
+        self.trail_min = 0.0
+        self.trail_max = None
+
+    def state(self):
+        return {
+            **super().state(),
+            "trail_min": self.trail_min,
+            "trail_max": self.trail_max,
+        }
+
+    def restore(self, state):
+        super().restore(state)
+        self.trail_min = state["trail_min"]
+        self.trail_max = state["trail_max"]
+
+    def update_trail_limits(self):
+        num_cities = len(self.instance)
+        self.trail_max = 1.0 / (self.evaporation_rate * self.best_distance)
+        p_dec = self.p_best ** (1.0 / num_cities)
+        average_choices = max(num_cities / 2.0 - 1.0, 1.0)
+        self.trail_min = min(
+            self.trail_max * (1.0 - p_dec) / (average_choices * p_dec), self.trail_max
+        )
+
+    def update_pheromone(self, tours, lengths, iter_best):
+        first_update = self.trail_max is None
+        self.update_trail_limits()
+        if first_update:
+            self.pheromone.fill(self.trail_max)
+
+        evaporate_pheromone(self.pheromone, self.evaporation_rate)
+        if (self.iteration + 1) % self.global_best_interval == 0:
+            deposit_pheromone(self.pheromone, self.best_tour, self.best_distance)
+        else:
+            deposit_pheromone(self.pheromone, tours[iter_best], lengths[iter_best])
+        np.clip(self.pheromone, self.trail_min, self.trail_max, out=self.pheromone)
+
+
+class AntColonySystem(AntColony):
+    name = "acs"
+
+    def __init__(self, instance, exploitation=0.9, local_evaporation=0.1, **params):
+        super().__init__(instance, **params)
+        self.exploitation = exploitation
+        self.local_evaporation = local_evaporation
+
+        if np.isfinite(self.best_distance):
+            reference = self.best_distance
+        else:
+            greedy_tour = construct_tours(
+                self.pheromone,
+                self.eta_beta,
+                self.alpha,
+                1,
+                self.rng,
+                exploitation=1.0,
+                candidates=self.candidates,
+            )
+            reference = instance.tour_length(greedy_tour[0])
+        self.tau0 = 1.0 / (len(instance) * reference)
+        self.pheromone.fill(self.tau0)
+
+    def state(self):
+        return {**super().state(), "tau0": self.tau0}
+
+    def restore(self, state):
+        super().restore(state)
+        self.tau0 = state["tau0"]
+
+    def construct(self):
+        with self.stats.phase("construction"):
+            tours = construct_tours(
+                self.pheromone,
+                self.eta_beta,
+                self.alpha,
+                self.num_ants,
+                self.rng,
+                exploitation=self.exploitation,
+                local_update=(self.local_evaporation, self.tau0),
+                candidates=self.candidates,
+            )
+        with self.stats.phase("evaluation"):
+            return tours, self.instance.tour_lengths(tours)
+
+    def update_pheromone(self, tours, lengths, iter_best):
+        src, dst = tour_edges(self.best_tour)
+        trail = (1.0 - self.evaporation_rate) * self.pheromone[src, dst]
+        trail += self.evaporation_rate / self.best_distance
+        self.pheromone[src, dst] = self.pheromone[dst, src] = trail
+
+
+ACO_VARIANTS = {
+    "as": AntColony,
+    "mmas": MaxMinAntSystem,
+    "acs": AntColonySystem,
+}
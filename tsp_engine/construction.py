@@ -0,0 +1,206 @@
+import numpy as np
+
+from .population import index_dtype
+
+HILBERT_ORDER = 16
+
+
+def nearest_neighbor_tour(instance, rng, num_neighbors=10):
+    n = len(instance)
+    index = instance.spatial_index
+    neighbors = instance.neighbors(num_neighbors).tolist()
+    visited = np.zeros(n, dtype=bool)
+    tour = np.empty(n, dtype=index_dtype(n))
+    current = int(rng.integers(n))
+    for step in range(n):
+        tour[step] = current
+        visited[current] = True
+        if step == n - 1:
+            break
+        for city in neighbors[current]:
+            if not visited[city]:
+                current = city
+                break
+        else:
+            if index is not None:
+                current = index.nearest_where(current, ~visited)
+            else:
+                row = instance.distances(current, slice(None))
+                current = int(np.argmin(np.where(visited, np.inf, row)))
+    return tour
+
+
+def greedy_tour(instance, rng, num_neighbors=10):
+    n = len(instance)
+    neighbors = instance.neighbors(num_neighbors)
+    src = np.repeat(np.arange(n), neighbors.shape[1])
+    dst = neighbors.ravel().astype(np.int64)
+    keep = src < dst
+    src, dst = src[keep], dst[keep]
+    order = np.argsort(instance.distances(src, dst), kind="stable")
+
+    degree = np.zeros(n, dtype=np.int8)
+    links = [[] for _ in range(n)]
+    fragment = list(range(n))
+
+    def root(city):
+        while fragment[city] != city:
+            fragment[city] = fragment[fragment[city]]
+            city = fragment[city]
+        return city
+
+    for a, b in zip(src[order].tolist(), dst[order].tolist()):
+        if degree[a] < 2 and degree[b] < 2 and root(a) != root(b):
+            links[a].append(b)
+            links[b].append(a)
+            degree[a] += 1
+            degree[b] += 1
+            fragment[root(a)] = root(b)
+
+    paths = []
+    seen = np.zeros(n, dtype=bool)
+    for city in np.flatnonzero(degree < 2).tolist():
+        if seen[city]:
+            continue
+        path, previous = [city], -1
+        while True:
+            seen[path[-1]] = True
+            following = [c for c in links[path[-1]] if c != previous]
+            if not following:
+                break
+            previous = path[-1]
+            path.append(following[0])
+        paths.append(path)
+
+    starts = np.array([path[0] for path in paths])
+    ends = np.array([path[-1] for path in paths])
+    remaining = np.ones(len(paths), dtype=bool)
+    remaining[0] = False
+    pieces, tail = [paths[0]], ends[0]
+    for _ in range(len(paths) - 1):
+        to_start = np.where(remaining, instance.distances(tail, starts), np.inf)
+        to_end = np.where(remaining, instance.distances(tail, ends), np.inf)
+        i, j = int(np.argmin(to_start)), int(np.argmin(to_end))
+        if to_start[i] <= to_end[j]:
+            pieces.append(paths[i])
+            remaining[i], tail = False, ends[i]
+        else:
+            pieces.append(paths[j][::-1])
+            remaining[j], tail = False, starts[j]
+
+    tour = np.concatenate(pieces).astype(index_dtype(n))
+    return np.roll(tour, -int(rng.integers(n)))
+
+
+def hilbert_index(coords, order=HILBERT_ORDER):
+    side = 1 << order
+    low = coords.min(axis=0)
+    span = (coords.max(axis=0) - low).max() or 1.0
+    x, y = ((coords - low) / span * (side - 1)).astype(np.int64).T
+    index = np.zeros(len(coords), dtype=np.int64)
+    s = side >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        index += s * s * ((3 * rx) ^ ry)
+        flip = ~ry
+        mirror = flip & rx
+        x[mirror] = side - 1 - x[mirror]
+        y[mirror] = side - 1 - y[mirror]
+        x[flip], y[flip] = y[flip], x[flip]
+        s >>= 1
+    return index
+
+
+def space_filling_curve_tour(instance, rng):
+    n = len(instance)
+    tour = np.argsort(hilbert_index(instance.coords), kind="stable")
+    return np.roll(tour, -int(rng.integers(n))).astype(index_dtype(n))
+
+
+def insertion_tour(instance, rng, farthest=False):
+    n = len(instance)
+    values = instance.matrix.values
+    first = int(rng.integers(n))
+    row = np.where(np.arange(n) == first, np.nan, values[first])
+    second = int(np.nanargmax(row) if farthest else np.nanargmin(row))
+
+    successor = np.full(n, -1, dtype=np.int64)
+    successor[first], successor[second] = second, first
+    members = np.empty(n, dtype=np.int64)
+    members[:2] = first, second
+    outside = np.ones(n, dtype=bool)
+    outside[[first, second]] = False
+
+    nearest = np.minimum(values[first], values[second]).astype(np.float64)
+    cost = values[first] + values[second] - values[first, second]
+    cost = cost.astype(np.float64)
+    after = np.full(n, first, dtype=np.int64)
+    stale = np.zeros(n, dtype=bool)
+
+    for size in range(2, n):
+        while True:
+            if farthest:
+                city = int(np.argmax(np.where(outside, nearest, -np.inf)))
+            else:
+                city = int(np.argmin(np.where(outside, cost, np.inf)))
+            if not stale[city]:
+                break
+            tour_nodes = members[:size]
+            next_nodes = successor[tour_nodes]
+            detour = (
+                values[city, tour_nodes]
+                + values[city, next_nodes]
+                - values[tour_nodes, next_nodes]
+            )
+            best = int(np.argmin(detour))
+            cost[city], after[city] = detour[best], tour_nodes[best]
+            stale[city] = False
+
+        a = int(after[city])
+        b = int(successor[a])
+        successor[a], successor[city] = city, b
+        members[size] = city
+        outside[city] = False
+        np.minimum(nearest, values[city], out=nearest)
+
+        stale |= outside & (after == a)
+        for u, v in ((a, city), (city, b)):
+            detour = values[u] + values[v] - values[u, v]
+            better = outside & (detour < cost)
+            cost[better] = detour[better]
+            after[better] = u
+
+    tour = np.empty(n, dtype=index_dtype(n))
+    city = first
+    for step in range(n):
+        tour[step] = city
+        city = successor[city]
+    return tour
+
+
+def cheapest_insertion_tour(instance, rng):
+    return insertion_tour(instance, rng)
+
+
+def farthest_insertion_tour(instance, rng):
+    return insertion_tour(instance, rng, farthest=True)
+
+
+CONSTRUCTIONS = {
+    "nearest": nearest_neighbor_tour,
+    "greedy": greedy_tour,
+    "hilbert": space_filling_curve_tour,
+    "cheapest": cheapest_insertion_tour,
+    "farthest": farthest_insertion_tour,
+}
+
+
+def construct_tour(instance, method="nearest", rng=None):
+    if method not in CONSTRUCTIONS:
+        raise ValueError(
+            f"Unknown construction '{method}', expected one of {sorted(CONSTRUCTIONS)}."
+        )
+    if len(instance) < 3:
+        return np.arange(len(instance), dtype=index_dtype(len(instance)))
+    return CONSTRUCTIONS[method](instance, np.random.default_rng(rng))
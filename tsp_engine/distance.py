@@ -0,0 +1,209 @@
+import numpy as np
+
+DTYPES = {"float32": np.float32, "float64": np.float64}
+
+EARTH_RADIUS = 6378.388
+
+
+def euclidean(coords_a, coords_b):
+    diff = coords_a - coords_b
+    return np.sqrt((diff**2).sum(axis=-1))
+
+
+def euc_2d(coords_a, coords_b):
+    return np.floor(euclidean(coords_a, coords_b) + 0.5)
+
+
+def ceil_2d(coords_a, coords_b):
+    return np.ceil(euclidean(coords_a, coords_b))
+
+
+def att(coords_a, coords_b):
+    diff = coords_a - coords_b
+    pseudo = np.sqrt((diff**2).sum(axis=-1) / 10.0)
+    rounded = np.floor(pseudo + 0.5)
+    return np.where(rounded < pseudo, rounded + 1.0, rounded)
+
+
+def geo_radians(coords):
+    degrees = np.trunc(coords)
+    return np.pi * (degrees + 5.0 * (coords - degrees) / 3.0) / 180.0
+
+
+def geo(coords_a, coords_b):
+    a, b = geo_radians(coords_a), geo_radians(coords_b)
+    q1 = np.cos(a[..., 1] - b[..., 1])
+    q2 = np.cos(a[..., 0] - b[..., 0])
+    q3 = np.cos(a[..., 0] + b[..., 0])
+    cosine = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+    return np.trunc(EARTH_RADIUS * np.arccos(cosine) + 1.0)
+
+
+METRICS = {
+    "euclidean": euclidean,
+    "EUC_2D": euc_2d,
+    "CEIL_2D": ceil_2d,
+    "ATT": att,
+    "GEO": geo,
+}
+
+
+def pairwise_distances(
+    coords_a,
+    coords_b,
+    dtype=np.float64,
+    metric="euclidean",
+    out=None,
+    chunk_size=1 << 20,
+):
+    if out is None:
+        out = np.empty((len(coords_a), len(coords_b)), dtype=dtype)
+    rows = max(1, chunk_size // max(len(coords_b), 1))
+    for start in range(0, len(coords_a), rows):
+        out[start : start + rows] = METRICS[metric](
+            coords_a[start : start + rows, None, :], coords_b[None, :, :]
+        )
+    return out
+
+
+def edge_lengths(coords, tour, metric="euclidean"):
+    tour = np.asarray(tour)
+    return METRICS[metric](coords[tour], coords[np.roll(tour, -1)])
+
+
+def tour_lengths(values, tours, chunk_size=1 << 22):
+    tours = np.asarray(tours)
+    if tours.ndim != 2 or tours.shape[1] < 2:
+        return np.zeros(len(tours))
+    lengths = np.empty(len(tours))
+    rows = max(1, chunk_size // tours.shape[1])
+    for start in range(0, len(tours), rows):
+        block = tours[start : start + rows]
+        lengths[start : start + rows] = values[block, np.roll(block, -1, axis=1)].sum(
+            axis=1, dtype=np.float64
+        )
+    return lengths
+
+
+class DistanceMatrix:
+    def __init__(
+        self, coords, dtype=np.float64, metric="euclidean", values=None, path=None
+    ):
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        if metric != "explicit" and metric not in METRICS:
+            raise ValueError(
+                f"Unknown distance metric '{metric}', expected one of {sorted(METRICS)}."
+            )
+        self.metric = metric
+        self.size = len(coords)
+        self.path = path
+        if path is not None:
+            self._buffer = np.load(path, mmap_mode="r")
+            if self._buffer.shape != (self.size, self.size):
+                raise ValueError(
+                    f"Distance matrix {path} does not match {self.size} cities."
+                )
+            self.dtype = self._buffer.dtype
+            self._coords = coords.copy()
+            return
+
+        self.dtype = np.dtype(dtype)
+        capacity = max(self.size, 16)
+        self._coords = np.zeros((capacity, 2))
+        self._coords[: self.size] = coords
+        self._buffer = np.zeros((capacity, capacity), dtype=self.dtype)
+        if metric == "explicit":
+            self._buffer[: self.size, : self.size] = values
+        else:
+            pairwise_distances(coords, coords, metric=metric, out=self.values)
+            np.fill_diagonal(self.values, 0)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.path is not None:
+            del state["_buffer"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.path is not None:
+            self._buffer = np.load(self.path, mmap_mode="r")
+
+    def save(self, path):
+        np.save(path, np.ascontiguousarray(self.values))
+
+    @property
+    def values(self):
+        return self._buffer[: self.size, : self.size]
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def _grow(self):
+        capacity = 2 * len(self._buffer)
+        coords = np.zeros((capacity, 2))
+        coords[: self.size] = self._coords[: self.size]
+        buffer = np.zeros((capacity, capacity), dtype=self.dtype)
+        buffer[: self.size, : self.size] = self.values
+        self._coords, self._buffer = coords, buffer
+        self.path = None
+
+    def add_city(self, coord):
+        if self.metric == "explicit":
+            raise ValueError("Cities cannot be added to an explicit distance matrix.")
+        if self.size == len(self._buffer):
+            self._grow()
+        n = self.size
+        self._coords[n] = coord
+        row = pairwise_distances(
+            self._coords[n : n + 1], self._coords[: n + 1], metric=self.metric
+        )[0]
+        row[n] = 0
+        self._buffer[n, : n + 1] = row
+        self._buffer[: n + 1, n] = row
+        self.size += 1
+        return n
+
+    def remove_city(self, index):
+        n = self.size
+        if not 0 <= index < n:
+            raise IndexError(f"City index {index} out of range for {n} cities.")
+        if self.path is not None:
+            self._coords, self._buffer = self._coords.copy(), np.array(self._buffer)
+            self.path = None
+        self._coords[index : n - 1] = self._coords[index + 1 : n]
+        self._buffer[index : n - 1, :n] = self._buffer[index + 1 : n, :n]
+        self._buffer[: n - 1, index : n - 1] = self._buffer[: n - 1, index + 1 : n]
+        self.size -= 1
+
+    def nearest(self, k, chunk_size=1 << 22):
+        n = self.size
+        k = min(k, n - 1)
+        if k <= 0:
+            return np.empty((n, 0), dtype=np.int32)
+        values = self.values
+        neighbors = np.empty((n, k), dtype=np.int32)
+        rows = max(1, chunk_size // n)
+        for start in range(0, n, rows):
+            block = values[start : start + rows].astype(np.float64)
+            block[np.arange(len(block)), np.arange(start, start + len(block))] = np.inf
+            candidates = np.argpartition(block, k - 1, axis=1)[:, :k]
+            order = np.argsort(
+                np.take_along_axis(block, candidates, axis=1), axis=1, kind="stable"
+            )
+            neighbors[start : start + rows] = np.take_along_axis(
+                candidates, order, axis=1
+            )
+        return neighbors
+
+    def tour_lengths(self, tours, chunk_size=1 << 22):
+        return tour_lengths(self.values, tours, chunk_size)
+
+    def tour_length(self, tour):
+        tour = np.asarray(tour)
+        if len(tour) < 2:
+            return 0.0
+        return float(self.values[tour, np.roll(tour, -1)].sum(dtype=np.float64))
@@ -0,0 +1,71 @@
+import os
+
+from .checkpoint import Checkpointer, load_checkpoint
+from .colony import AntColony, AntColonySystem, MaxMinAntSystem
+from .genetic import GeneticAlgorithm
+from .islands import IslandModel
+from .local_search import MultiStartLocalSearch
+from .parallel_colony import ParallelAntColony, ParallelMaxMinAntSystem
+from .portfolio import Portfolio
+from .progress import NO_PROGRESS
+
+SOLVERS = {
+    "ga": GeneticAlgorithm,
+    "islands": IslandModel,
+    "aco": AntColony,
+    "mmas": MaxMinAntSystem,
+    "acs": AntColonySystem,
+    "aco-parallel": ParallelAntColony,
+    "mmas-parallel": ParallelMaxMinAntSystem,
+    "multistart": MultiStartLocalSearch,
+    "portfolio": Portfolio,
+}
+
+
+def create_solver(instance, algorithm="ga", **params):
+    if algorithm not in SOLVERS:
+        raise ValueError(
+            f"Unknown algorithm '{algorithm}', expected one of {sorted(SOLVERS)}."
+        )
+    return SOLVERS[algorithm](instance, **params)
+
+
+def solve(
+    instance,
+    algorithm="ga",
+    checkpoint=None,
+    checkpoint_interval=60.0,
+    resume=False,
+    progress=None,
+    **params,
+):
+    solver = create_solver(instance, algorithm, **params)
+    progress = progress or NO_PROGRESS
+    if checkpoint is None and not progress.enabled:
+        return solver.run()
+
+    try:
+        checkpointer = None
+        if checkpoint is not None:
+            if resume and os.path.exists(checkpoint):
+                load_checkpoint(solver, checkpoint)
+            checkpointer = Checkpointer(checkpoint, checkpoint_interval)
+            checkpointer.save(solver)
+        progress.start()
+        if not hasattr(solver, "step"):
+            return progress.finish(solver.run())
+
+        while not solver.done:
+            _, current_distance = solver.step()
+            progress.update(solver, current_distance)
+            if checkpointer is not None:
+                checkpointer.update(solver)
+        progress.phase_finished("search")
+        if checkpointer is not None:
+            checkpointer.save(solver)
+        result = solver.finish()
+        progress.phase_finished("finish")
+        return progress.finish(result)
+    finally:
+        if hasattr(solver, "close"):
+            solver.close()
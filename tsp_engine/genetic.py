@@ -0,0 +1,368 @@
+import time
+
+import numpy as np
+
+from .annealing import DEFAULT_ANNEALING, anneal
+from .construction import CONSTRUCTIONS, construct_tour
+from .local_search import LOCAL_SEARCH, double_bridge, local_search
+from .population import Population
+from .profiling import NO_STATS
+from .result import SolveResult
+from .termination import Termination
+
+
+def initialize_population(tours, rng):
+    tours[:] = np.arange(tours.shape[1], dtype=tours.dtype)
+    rng.permuted(tours, axis=1, out=tours)
+
+
+def seed_population(instance, tours, method, fraction, rng):
+    count = min(len(tours), int(np.ceil(fraction * len(tours))))
+    if count == 0:
+        return
+    tours[0] = construct_tour(instance, method, rng)
+    for tour in tours[1:count]:
+        tour[:] = double_bridge(tours[0], rng)
+
+
+def evaluate_population(instance, tours, out=None):
+    fitness = instance.tour_lengths(tours)
+    if out is None:
+        return fitness
+    out[:] = fitness
+    return out
+
+
+def tournament_selection(fitness, num_parents, rng, tournament_size=5):
+    if len(fitness) == 0:
+        return np.array([], dtype=int)
+
+    contestants = rng.integers(
+        len(fitness), size=(num_parents, min(tournament_size, len(fitness)))
+    )
+    winners = np.argmin(fitness[contestants], axis=1)
+    return contestants[np.arange(num_parents), winners]
+
+
+def ordered_crossover(parent1, parent2, rng, out=None):
+    size = len(parent1)
+    child = out if out is not None else np.empty(size, dtype=parent1.dtype)
+    if size < 2:
+        child[:] = parent1
+        return child
+
+    start, end = np.sort(rng.choice(size, 2, replace=False))
+    end += 1
+
+    visited = np.zeros(size, dtype=bool)
+    visited[parent1[start:end]] = True
+    remaining = parent2[~visited[parent2]]
+
+    child[start:end] = parent1[start:end]
+    child[:start] = remaining[:start]
+    child[end:] = remaining[start:]
+    return child
+
+
+def crossover_points(num_children, size, rng):
+    first = rng.integers(size, size=num_children)
+    second = rng.integers(size - 1, size=num_children)
+    second += second >= first
+    return np.minimum(first, second), np.maximum(first, second)
+
+
+def ordered_crossover_batch(parents1, parents2, rng, out=None):
+    num_children, size = parents1.shape
+    children = out if out is not None else np.empty_like(parents1)
+    if size < 2:
+        children[:] = parents1
+        return children
+
+    starts, ends = crossover_points(num_children, size, rng)
+    positions = np.arange(size)
+    segment = (positions >= starts[:, None]) & (positions <= ends[:, None])
+
+    rows = np.arange(num_children)[:, None]
+    visited = np.empty((num_children, size), dtype=bool)
+    visited[rows, parents1] = segment
+    remaining = ~visited[rows, parents2]
+
+    children[segment] = parents1[segment]
+    children[~segment] = parents2[remaining]
+    return children
+
+
+def segment_positions(tours, rng):
+    starts, ends = crossover_points(len(tours), tours.shape[1], rng)
+    positions = np.arange(tours.shape[1])
+    segment = (positions >= starts[:, None]) & (positions <= ends[:, None])
+    return starts[:, None], ends[:, None], positions, segment
+
+
+def swap_mutation(tours, rng):
+    rows = np.arange(len(tours))
+    first, second = crossover_points(len(tours), tours.shape[1], rng)
+    tours[rows, first], tours[rows, second] = tours[rows, second], tours[rows, first]
+    return tours
+
+
+def inversion_mutation(tours, rng):
+    starts, ends, positions, segment = segment_positions(tours, rng)
+    source = np.where(segment, starts + ends - positions, positions)
+    return np.take_along_axis(tours, source, axis=1)
+
+
+def scramble_mutation(tours, rng):
+    starts, ends, positions, segment = segment_positions(tours, rng)
+    keys = starts - 0.5 + rng.random(tours.shape) * (ends - starts + 1)
+    source = np.argsort(np.where(segment, keys, positions), axis=1)
+    return np.take_along_axis(tours, source, axis=1)
+
+
+MUTATIONS = {
+    "swap": swap_mutation,
+    "inversion": inversion_mutation,
+    "scramble": scramble_mutation,
+}
+
+
+def mutate_population(tours, mutation_rate_val, rng, mutation="swap"):
+    if tours.shape[1] < 2:
+        return
+    mutated = np.flatnonzero(rng.random(len(tours)) < mutation_rate_val)
+    if len(mutated):
+        tours[mutated] = MUTATIONS[mutation](tours[mutated], rng)
+
+
+def polish(
+    instance, tour, local_search_method, annealing, rng, stats=NO_STATS, time_limit=None
+):
+    started = time.perf_counter()
+    with stats.phase("local_search"):
+        tour, _, search_stats = local_search(
+            instance, tour, local_search_method, time_limit
+        )
+    stats.count("local_search_moves", search_stats["moves_evaluated"])
+    if time_limit is not None:
+        remaining = max(time_limit - (time.perf_counter() - started), 0.0)
+        if annealing.get("time_limit") is not None:
+            remaining = min(remaining, annealing["time_limit"])
+        annealing = {**annealing, "time_limit": remaining}
+    with stats.phase("annealing"):
+        tour, distance, anneal_stats = anneal(instance, tour, rng=rng, **annealing)
+    stats.count("annealing_moves", anneal_stats["moves_evaluated"])
+    return tour, distance, search_stats
+
+
+def validate_params(
+    instance,
+    population_size=100,
+    mutation_rate=0.2,
+    mutation="swap",
+    tournament_size=5,
+    initialization="random",
+    heuristic_fraction=0.1,
+    local_search="2opt",
+):
+    if len(instance) < 3:
+        raise ValueError("Please add at least 3 cities to run the algorithm.")
+    if population_size < 1:
+        raise ValueError("Population size must be at least 1.")
+    if not 0.0 <= mutation_rate <= 1.0:
+        raise ValueError("Mutation rate must be between 0 and 1.")
+    if tournament_size < 1:
+        raise ValueError("Tournament size must be at least 1.")
+    if mutation not in MUTATIONS:
+        raise ValueError(f"Unknown mutation '{mutation}'.")
+    if initialization != "random" and initialization not in CONSTRUCTIONS:
+        raise ValueError(
+            f"Unknown construction '{initialization}', "
+            f"expected one of {sorted(CONSTRUCTIONS)}."
+        )
+    if not 0.0 <= heuristic_fraction <= 1.0:
+        raise ValueError("Heuristic fraction must be between 0 and 1.")
+    if local_search not in LOCAL_SEARCH:
+        raise ValueError(f"Unknown local search '{local_search}'.")
+
+
+class GeneticAlgorithm:
+    name = "ga"
+
+    def __init__(
+        self,
+        instance,
+        population_size=100,
+        generations=150,
+        mutation_rate=0.2,
+        mutation="swap",
+        tournament_size=5,
+        initialization="random",
+        heuristic_fraction=0.1,
+        local_search="2opt",
+        annealing=None,
+        termination=None,
+        stats=None,
+        seed=None,
+    ):
+        validate_params(
+            instance,
+            population_size=population_size,
+            mutation_rate=mutation_rate,
+            mutation=mutation,
+            tournament_size=tournament_size,
+            initialization=initialization,
+            heuristic_fraction=heuristic_fraction,
+            local_search=local_search,
+        )
+        self.instance = instance
+        self.population_size = population_size
+        self.generations = generations
+        self.mutation_rate = mutation_rate
+        self.mutation = mutation
+        self.tournament_size = tournament_size
+        self.local_search = local_search
+        self.annealing = {**DEFAULT_ANNEALING, **(annealing or {})}
+        self.rng = np.random.default_rng(seed)
+        self.termination = termination or Termination()
+        self.termination.start()
+        self.stats = stats or NO_STATS
+
+        self.population = Population(
+            population_size, (population_size // 2) // 2, len(instance)
+        )
+        with self.stats.phase("initialization"):
+            initialize_population(self.population.tours, self.rng)
+            if initialization != "random":
+                seed_population(
+                    instance,
+                    self.population.tours,
+                    initialization,
+                    heuristic_fraction,
+                    self.rng,
+                )
+        with self.stats.phase("evaluation"):
+            evaluate_population(
+                instance, self.population.tours, out=self.population.fitness
+            )
+        self.stats.count_tours(population_size, len(instance))
+        self.generation = 0
+        self.best_distances = []
+        self.initial_best_tour, self.initial_best_distance = self.best()
+        self.termination.record(
+            self.initial_best_distance, population_size * len(instance), steps=0
+        )
+
+    @property
+    def done(self):
+        return self.generation >= self.generations or self.termination.reached
+
+    def step(self):
+        population = self.population
+        best_tour, best_distance = population.best()
+
+        stats = self.stats
+        with stats.phase("selection"):
+            parents = tournament_selection(
+                population.fitness,
+                int(self.population_size / 2),
+                self.rng,
+                self.tournament_size,
+            )
+        offspring = population.offspring
+        if len(offspring):
+            num_children = len(offspring)
+            with stats.phase("crossover"):
+                ordered_crossover_batch(
+                    population.tours[parents[0 : 2 * num_children : 2]],
+                    population.tours[parents[1 : 2 * num_children : 2]],
+                    self.rng,
+                    out=offspring,
+                )
+            with stats.phase("mutation"):
+                mutate_population(
+                    offspring, self.mutation_rate, self.rng, self.mutation
+                )
+            with stats.phase("evaluation"):
+                evaluate_population(
+                    self.instance, offspring, out=population.offspring_fitness
+                )
+            stats.count_tours(num_children, len(self.instance))
+            with stats.phase("replacement"):
+                population.truncate()
+
+        self.termination.record(
+            population.fitness.min(), len(offspring) * len(self.instance)
+        )
+        self.best_distances.append(best_distance)
+        self.generation += 1
+        return best_tour, best_distance
+
+    def best(self):
+        return self.population.best()
+
+    def emigrants(self, count):
+        order = np.argsort(self.population.fitness, kind="stable")[:count]
+        return self.population.tours[order], self.population.fitness[order]
+
+    def immigrate(self, tours, fitness=None):
+        count = min(len(tours), self.population_size - 1)
+        if count <= 0:
+            return
+        if fitness is None:
+            fitness = evaluate_population(self.instance, tours)
+        worst = np.argsort(self.population.fitness, kind="stable")[::-1][:count]
+        self.population.tours[worst] = tours[:count]
+        self.population.fitness[worst] = fitness[:count]
+
+    def adopt(self, tour, distance):
+        if distance < self.population.fitness.min():
+            self.immigrate(np.asarray(tour)[None, :], np.array([distance]))
+
+    def state(self):
+        return {
+            "tours": self.population.tours,
+            "fitness": self.population.fitness,
+            "initial_best_tour": self.initial_best_tour,
+            "initial_best_distance": self.initial_best_distance,
+            "generation": self.generation,
+            "best_distances": self.best_distances,
+            "rng": self.rng.bit_generator.state,
+            "termination": self.termination.state(),
+        }
+
+    def restore(self, state):
+        self.population.tours[:] = state["tours"]
+        self.population.fitness[:] = state["fitness"]
+        self.initial_best_tour = state["initial_best_tour"]
+        self.initial_best_distance = state["initial_best_distance"]
+        self.generation = state["generation"]
+        self.best_distances[:] = state["best_distances"]
+        self.rng.bit_generator.state = state["rng"]
+        self.termination.restore(state["termination"])
+
+    def finish(self):
+        stop_reason = self.termination.reason if self.termination.reached else None
+        self.pre_opt_tour, self.pre_opt_distance = self.best()
+        best_tour_sa, best_distance_sa, self.local_search_stats = polish(
+            self.instance,
+            self.pre_opt_tour,
+            self.local_search,
+            self.annealing,
+            self.rng,
+            self.stats,
+            self.termination.remaining,
+        )
+        self.best_distances.append(best_distance_sa)
+        return SolveResult(
+            self.instance,
+            best_tour_sa,
+            best_distance_sa,
+            self.best_distances,
+            self.name,
+            stop_reason,
+        )
+
+    def run(self):
+        while not self.done:
+            self.step()
+        return self.finish()
@@ -0,0 +1,213 @@
+import json
+import os
+
+import numpy as np
+
+from .distance import METRICS, DistanceMatrix, edge_lengths
+from .spatial import GRID_METRICS, GridIndex
+from .tsplib import read_tour, read_tsplib
+
+
+CANDIDATES = ("nearest", "quadrant")
+
+
+class Instance:
+    def __init__(
+        self,
+        names,
+        coords,
+        dtype=np.float64,
+        metric="euclidean",
+        weights=None,
+        matrix=None,
+    ):
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        if len(names) != len(coords):
+            raise ValueError("Every city needs exactly one coordinate pair.")
+        self.names = list(names)
+        self.coords = coords
+        self.dtype = np.dtype(dtype)
+        self.metric = "explicit" if weights is not None else metric
+        self.city_indices = {name: index for index, name in enumerate(self.names)}
+        self._matrix = None
+        self._index = None
+        self._neighbors = None
+        if matrix is not None:
+            self.metric = matrix.metric
+            self._matrix = matrix
+        elif weights is not None:
+            self._matrix = DistanceMatrix(coords, dtype, "explicit", weights)
+        elif metric not in METRICS:
+            raise ValueError(
+                f"Unknown distance metric '{metric}', expected one of {sorted(METRICS)}."
+            )
+
+    @classmethod
+    def from_cities(cls, cities, dtype=np.float64):
+        return cls(list(cities.keys()), list(cities.values()), dtype)
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def matrix(self):
+        if self._matrix is None:
+            self._matrix = DistanceMatrix(self.coords, self.dtype, self.metric)
+        return self._matrix
+
+    @property
+    def spatial_index(self):
+        if self._index is None and self.metric in GRID_METRICS:
+            self._index = GridIndex(self.coords)
+        return self._index
+
+    def neighbors(self, k):
+        if self._neighbors is None or self._neighbors.shape[1] < min(k, len(self) - 1):
+            index = self.spatial_index
+            self._neighbors = index.nearest(k) if index else self.matrix.nearest(k)
+        return self._neighbors[:, :k]
+
+    def candidates(self, k, kind="nearest"):
+        if kind == "nearest":
+            return self.neighbors(k)
+        if kind != "quadrant":
+            raise ValueError(
+                f"Unknown candidate list '{kind}', expected one of {list(CANDIDATES)}."
+            )
+        if self.spatial_index is None:
+            raise ValueError(
+                f"Quadrant candidates need planar coordinates, not '{self.metric}'."
+            )
+        return self.spatial_index.quadrant_neighbors(k)
+
+    def to_cities(self):
+        return {name: tuple(c) for name, c in zip(self.names, self.coords.tolist())}
+
+    def add_city(self, name, coord):
+        if name in self.city_indices:
+            raise ValueError(f"City '{name}' already exists.")
+        if self._matrix is not None:
+            self._matrix.add_city(coord)
+        self.coords = np.vstack([self.coords, np.asarray(coord, dtype=np.float64)])
+        self.city_indices[name] = len(self.names)
+        self.names.append(name)
+        self._index = None
+        self._neighbors = None
+
+    def remove_city(self, name):
+        index = self.city_indices.pop(name)
+        del self.names[index]
+        self.coords = np.delete(self.coords, index, axis=0)
+        for moved in self.names[index:]:
+            self.city_indices[moved] -= 1
+        self._index = None
+        self._neighbors = None
+        if self._matrix is not None:
+            self._matrix.remove_city(index)
+
+    def distance(self, i, j):
+        return float(self.matrix.values[i, j])
+
+    def distances(self, src, dst):
+        if self._matrix is not None:
+            return self._matrix.values[src, dst]
+        return METRICS[self.metric](self.coords[src], self.coords[dst])
+
+    def tour_length(self, tour):
+        if self._matrix is None and len(tour) > 1:
+            return float(edge_lengths(self.coords, tour, self.metric).sum())
+        return self.matrix.tour_length(tour)
+
+    def tour_lengths(self, tours):
+        return self.matrix.tour_lengths(tours)
+
+    def tour_names(self, tour):
+        return [self.names[i] for i in tour]
+
+
+def load_cities(filepath):
+    with open(filepath, "r") as f:
+        loaded_cities = json.load(f)
+    if not isinstance(loaded_cities, dict):
+        raise ValueError("File does not contain a valid city dictionary.")
+    for name, coords in loaded_cities.items():
+        if not (
+            isinstance(name, str)
+            and isinstance(coords, list)
+            and len(coords) == 2
+            and all(isinstance(c, (int, float)) for c in coords)
+        ):
+            raise ValueError("Invalid city data format in file.")
+    return {name: tuple(coords) for name, coords in loaded_cities.items()}
+
+
+def save_cities(cities, filepath):
+    with open(filepath, "w") as f:
+        json.dump(cities, f, indent=4)
+
+
+def load_tsplib(filepath, dtype=np.float64):
+    problem = read_tsplib(filepath)
+    metric = problem["metric"]
+    return Instance(
+        problem["ids"].astype(str),
+        problem["coords"],
+        dtype,
+        metric=metric if metric != "EXPLICIT" else "euclidean",
+        weights=problem["weights"],
+    )
+
+
+def load_tour(filepath, instance):
+    nodes = [str(node) for node in read_tour(filepath).tolist()]
+    unknown = [node for node in nodes if node not in instance.city_indices]
+    if unknown:
+        raise ValueError(
+            f"The tour in {filepath} refers to node ids {unknown[:5]} that are not "
+            "cities of the instance; tours can only be checked against the "
+            "TSPLIB file they were written for."
+        )
+    tour = np.array([instance.city_indices[node] for node in nodes])
+    if sorted(tour.tolist()) != list(range(len(instance))):
+        raise ValueError("The tour does not visit every city exactly once.")
+    return tour
+
+
+def matrix_path(filepath):
+    return os.path.splitext(os.path.abspath(filepath))[0] + ".matrix.npy"
+
+
+def save_instance(instance, filepath, include_matrix=False):
+    include_matrix = include_matrix or instance.metric == "explicit"
+    with open(filepath, "wb") as f:
+        np.savez_compressed(
+            f,
+            names=np.array(instance.names, dtype=str),
+            coords=instance.coords,
+            metric=np.array(instance.metric),
+            has_matrix=np.array(include_matrix),
+        )
+    if include_matrix:
+        instance.matrix.save(matrix_path(filepath))
+
+
+def load_npz(filepath, dtype=np.float64):
+    with np.load(filepath) as data:
+        names, coords = data["names"].tolist(), data["coords"]
+        metric, has_matrix = str(data["metric"]), bool(data["has_matrix"])
+    matrix = None
+    if has_matrix:
+        matrix = DistanceMatrix(coords, metric=metric, path=matrix_path(filepath))
+        if matrix.dtype != np.dtype(dtype) and metric != "explicit":
+            matrix = None
+    elif metric == "explicit":
+        raise ValueError(f"{filepath} has an explicit metric but no distance matrix.")
+    return Instance(names, coords, dtype, metric=metric, matrix=matrix)
+
+
+def load_instance(filepath, dtype=np.float64):
+    if str(filepath).lower().endswith(".tsp"):
+        return load_tsplib(filepath, dtype)
+    if str(filepath).lower().endswith(".npz"):
+        return load_npz(filepath, dtype)
+    return Instance.from_cities(load_cities(filepath), dtype)
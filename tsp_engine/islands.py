@@ -0,0 +1,202 @@
+import multiprocessing as mp
+import time
+
+import numpy as np
+
+from .annealing import DEFAULT_ANNEALING
+from .genetic import GeneticAlgorithm, polish, validate_params
+from .profiling import NO_STATS
+from .result import SolveResult
+from .termination import Termination
+
+TOPOLOGIES = ("ring", "random", "complete")
+
+
+def migration_sources(topology, num_islands, rng):
+    if num_islands < 2:
+        return [[] for _ in range(num_islands)]
+    if topology == "ring":
+        return [[(i - 1) % num_islands] for i in range(num_islands)]
+    if topology == "random":
+        offset = int(rng.integers(1, num_islands))
+        return [[(i - offset) % num_islands] for i in range(num_islands)]
+    if topology == "complete":
+        return [[j for j in range(num_islands) if j != i] for i in range(num_islands)]
+    raise ValueError(
+        f"Unknown migration topology '{topology}', expected one of {TOPOLOGIES}."
+    )
+
+
+def island_worker(conn, instance, ga_params, seed, num_migrants):
+    ga = GeneticAlgorithm(instance, seed=seed, **ga_params)
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        generations, migrants, time_limit = message
+        deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        if migrants is not None:
+            ga.immigrate(*migrants)
+        completed = 0
+        while completed < generations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            ga.step()
+            completed += 1
+        evaluations = completed * len(ga.population.offspring)
+        conn.send((*ga.emigrants(num_migrants), evaluations))
+    conn.close()
+
+
+class IslandModel:
+    name = "islands"
+
+    def __init__(
+        self,
+        instance,
+        num_islands=None,
+        migration_interval=10,
+        num_migrants=2,
+        topology="ring",
+        generations=150,
+        local_search="2opt",
+        annealing=None,
+        termination=None,
+        stats=None,
+        seed=None,
+        **ga_params,
+    ):
+        if topology not in TOPOLOGIES:
+            raise ValueError(
+                f"Unknown migration topology '{topology}', expected one of {TOPOLOGIES}."
+            )
+        if migration_interval < 1:
+            raise ValueError("Migration interval must be at least 1 generation.")
+        validate_params(instance, local_search=local_search, **ga_params)
+        self.instance = instance
+        self.num_islands = num_islands or mp.cpu_count()
+        self.migration_interval = migration_interval
+        self.num_migrants = num_migrants
+        self.topology = topology
+        self.generations = generations
+        self.local_search = local_search
+
+        seeds = np.random.SeedSequence(seed).spawn(self.num_islands + 1)
+        self.rng = np.random.default_rng(seeds[0])
+        self.annealing = {**DEFAULT_ANNEALING, **(annealing or {})}
+        self.termination = termination or Termination()
+        self.termination.start()
+        self.stats = stats or NO_STATS
+
+        self.epoch = 0
+        self.generation = 0
+        self.best_distances = []
+        self.best_tour = np.array([], dtype=int)
+        self.best_distance = float("inf")
+        self._inbox = [None] * self.num_islands
+        self._connections = []
+        self._workers = []
+        for island_seed in seeds[1:]:
+            parent_conn, child_conn = mp.Pipe()
+            worker = mp.Process(
+                target=island_worker,
+                args=(child_conn, instance, ga_params, island_seed, num_migrants),
+                daemon=True,
+            )
+            worker.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._workers.append(worker)
+
+    @property
+    def done(self):
+        return self.generation >= self.generations or self.termination.reached
+
+    def step(self):
+        generations = min(self.migration_interval, self.generations - self.generation)
+        with self.stats.phase("evolution"):
+            time_limit = self.termination.remaining
+            for conn, migrants in zip(self._connections, self._inbox):
+                conn.send((generations, migrants, time_limit))
+            elites = [conn.recv() for conn in self._connections]
+
+        for tours, fitness, _ in elites:
+            if len(fitness) and fitness[0] < self.best_distance:
+                self.best_tour = tours[0].copy()
+                self.best_distance = float(fitness[0])
+
+        with self.stats.phase("migration"):
+            sources = migration_sources(self.topology, self.num_islands, self.rng)
+            self._inbox = [
+                (
+                    np.concatenate([elites[j][0] for j in island_sources]),
+                    np.concatenate([elites[j][1] for j in island_sources]),
+                )
+                if island_sources
+                else None
+                for island_sources in sources
+            ]
+
+        evaluations = sum(evaluations for _, _, evaluations in elites)
+        self.stats.count_tours(evaluations, len(self.instance))
+        self.termination.record(
+            self.best_distance, evaluations * len(self.instance), steps=generations
+        )
+        self.generation += generations
+        self.epoch += 1
+        self.best_distances.append(self.best_distance)
+        return self.best_tour, self.best_distance
+
+    def best(self):
+        return self.best_tour, self.best_distance
+
+    def close(self):
+        for conn in self._connections:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+        for worker in self._workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        self._connections = []
+        self._workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def finish(self):
+        self.close()
+        stop_reason = self.termination.reason if self.termination.reached else None
+        self.pre_opt_tour, self.pre_opt_distance = self.best()
+        tour, distance, self.local_search_stats = polish(
+            self.instance,
+            self.pre_opt_tour,
+            self.local_search,
+            self.annealing,
+            self.rng,
+            self.stats,
+            self.termination.remaining,
+        )
+        self.best_distances.append(distance)
+        return SolveResult(
+            self.instance,
+            tour,
+            distance,
+            self.best_distances,
+            self.name,
+            stop_reason,
+        )
+
+    def run(self):
+        try:
+            while not self.done:
+                self.step()
+        finally:
+            self.close()
+        return self.finish()
@@ -0,0 +1,437 @@
+import time
+from collections import deque
+
+import numpy as np
+
+from .profiling import NO_STATS
+from .result import SolveResult
+from .termination import Termination
+
+
+def reverse_segment(tour, position, i, j):
+    n = len(tour)
+    length = (j - i) % n + 1
+    if 2 * length > n:
+        i, j = (j + 1) % n, (i - 1) % n
+        length = n - length
+    for _ in range(length // 2):
+        a, b = tour[i], tour[j]
+        tour[i], tour[j] = b, a
+        position[b], position[a] = i, j
+        i = i + 1 if i + 1 < n else 0
+        j = j - 1 if j > 0 else n - 1
+
+
+def exchange_edges(tour, position, a, b, c, d):
+    if tour[(position[a] + 1) % len(tour)] == b:
+        reverse_segment(tour, position, position[b], position[c])
+    else:
+        reverse_segment(tour, position, position[c], position[b])
+
+
+def two_opt(instance, tour, num_neighbors=10, time_limit=None):
+    started = time.perf_counter()
+    stats = {"improvements": 0, "moves_evaluated": 0, "gain": 0.0, "time": 0.0}
+    n = len(tour)
+    if n < 4:
+        stats["time"] = time.perf_counter() - started
+        return np.array(tour), instance.tour_length(tour), stats
+
+    d = instance.matrix.values.item
+    neighbors = instance.neighbors(num_neighbors).tolist()
+    dtype = np.asarray(tour).dtype
+    tour = np.asarray(tour).tolist()
+    position = [0] * n
+    for i, city in enumerate(tour):
+        position[city] = i
+
+    deadline = started + time_limit if time_limit is not None else None
+    active = deque(tour)
+    queued = [True] * n
+
+    while active:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        a = active.popleft()
+        queued[a] = False
+        for direction in (1, -1):
+            pa = position[a]
+            b = tour[(pa + direction) % n]
+            d_ab = d(a, b)
+            improved = False
+            for c in neighbors[a]:
+                d_ac = d(a, c)
+                if d_ac >= d_ab:
+                    break
+                pc = position[c]
+                e = tour[(pc + direction) % n]
+                if e == a:
+                    continue
+                stats["moves_evaluated"] += 1
+                delta = d_ac + d(b, e) - d_ab - d(c, e)
+                if delta < -1e-9:
+                    if direction == 1:
+                        reverse_segment(tour, position, (pa + 1) % n, pc)
+                    else:
+                        reverse_segment(tour, position, pa, (pc - 1) % n)
+                    stats["improvements"] += 1
+                    stats["gain"] -= delta
+                    for city in (a, b, c, e):
+                        if not queued[city]:
+                            queued[city] = True
+                            active.append(city)
+                    improved = True
+                    break
+            if improved:
+                break
+
+    tour = np.array(tour, dtype=dtype)
+    stats["time"] = time.perf_counter() - started
+    return tour, instance.tour_length(tour), stats
+
+
+def opt2_heuristic(instance, tour, num_neighbors=10, time_limit=None):
+    tour, distance, _ = two_opt(instance, tour, num_neighbors, time_limit)
+    return tour, distance
+
+
+def or_opt(instance, tour, num_neighbors=10, max_segment=3, time_limit=None):
+    started = time.perf_counter()
+    stats = {"improvements": 0, "moves_evaluated": 0, "gain": 0.0, "time": 0.0}
+    n = len(tour)
+    if n < 5:
+        stats["time"] = time.perf_counter() - started
+        return np.array(tour), instance.tour_length(tour), stats
+
+    d = instance.matrix.values.item
+    neighbors = instance.neighbors(num_neighbors).tolist()
+    dtype = np.asarray(tour).dtype
+    tour = np.asarray(tour).tolist()
+    position = [0] * n
+    for i, city in enumerate(tour):
+        position[city] = i
+    max_segment = min(max_segment, n - 3)
+
+    deadline = started + time_limit if time_limit is not None else None
+    active = deque(tour)
+    queued = [True] * n
+
+    def find_move(ps):
+        for length in range(1, max_segment + 1):
+            segment = [tour[(ps + k) % n] for k in range(length)]
+            members = set(segment)
+            first, last = segment[0], segment[-1]
+            prev_city, next_city = tour[ps - 1], tour[(ps + length) % n]
+            removal_gain = d(prev_city, first) + d(last, next_city)
+            removal_gain -= d(prev_city, next_city)
+            if removal_gain <= 1e-9:
+                continue
+            for end, other in ((first, last), (last, first)):
+                for c in neighbors[end]:
+                    d_end = d(end, c)
+                    if d_end >= removal_gain:
+                        break
+                    if c in members:
+                        continue
+                    pc = position[c]
+                    for c1, c2 in ((c, tour[(pc + 1) % n]), (tour[pc - 1], c)):
+                        if c1 in members or c2 in members:
+                            continue
+                        stats["moves_evaluated"] += 1
+                        if c == c1:
+                            added = d_end + d(other, c2)
+                        else:
+                            added = d(c1, other) + d_end
+                        delta = added - d(c1, c2) - removal_gain
+                        if delta < -1e-9:
+                            forward = (c == c1) == (end == first)
+                            return length, c1, c2, forward, delta
+        return None
+
+    while active:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        city = active.popleft()
+        queued[city] = False
+        ps = position[city]
+        move = find_move(ps)
+        if move is None:
+            continue
+
+        length, c1, c2, forward, delta = move
+        segment = [tour[(ps + k) % n] for k in range(length)]
+        first, last = segment[0], segment[-1]
+        prev_city, next_city = tour[ps - 1], tour[(ps + length) % n]
+        touched = segment + [prev_city, next_city, c1, c2]
+        exchange_edges(tour, position, prev_city, first, c1, c2)
+        exchange_edges(tour, position, prev_city, c1, next_city, last)
+        if forward:
+            exchange_edges(tour, position, c1, last, first, c2)
+
+        stats["improvements"] += 1
+        stats["gain"] -= delta
+        for moved in touched:
+            if not queued[moved]:
+                queued[moved] = True
+                active.append(moved)
+
+    tour = np.array(tour, dtype=dtype)
+    stats["time"] = time.perf_counter() - started
+    return tour, instance.tour_length(tour), stats
+
+
+def or_2opt(instance, tour, num_neighbors=10, max_segment=3, time_limit=None):
+    started = time.perf_counter()
+    stats = {"improvements": 0, "moves_evaluated": 0, "gain": 0.0, "time": 0.0}
+    distance = instance.tour_length(tour)
+    while True:
+        remaining = None
+        if time_limit is not None:
+            remaining = time_limit - (time.perf_counter() - started)
+            if remaining <= 0:
+                break
+        tour, distance, two_opt_stats = two_opt(
+            instance, tour, num_neighbors, remaining
+        )
+        if time_limit is not None:
+            remaining = time_limit - (time.perf_counter() - started)
+        tour, distance, or_opt_stats = or_opt(
+            instance, tour, num_neighbors, max_segment, remaining
+        )
+        for key in ("improvements", "moves_evaluated", "gain"):
+            stats[key] += two_opt_stats[key] + or_opt_stats[key]
+        if or_opt_stats["improvements"] == 0:
+            break
+    stats["time"] = time.perf_counter() - started
+    return np.asarray(tour), distance, stats
+
+
+def lin_kernighan(
+    instance, tour, num_neighbors=8, max_depth=6, breadth=5, time_limit=None
+):
+    started = time.perf_counter()
+    stats = {"improvements": 0, "moves_evaluated": 0, "gain": 0.0, "time": 0.0}
+    n = len(tour)
+    if n < 5:
+        stats["time"] = time.perf_counter() - started
+        return np.array(tour), instance.tour_length(tour), stats
+
+    d = instance.matrix.values.item
+    neighbors = instance.neighbors(num_neighbors).tolist()
+    dtype = np.asarray(tour).dtype
+    tour = np.asarray(tour).tolist()
+    position = [0] * n
+    for i, city in enumerate(tour):
+        position[city] = i
+
+    def reverse_path(t2, t4, direction):
+        if direction == 1:
+            i, j = position[t2], position[t4]
+        else:
+            i, j = position[t4], position[t2]
+        reverse_segment(tour, position, i, j)
+        return i, j
+
+    def candidates(t1, t2, direction, gain, removed, added):
+        found = []
+        for t3 in neighbors[t2]:
+            partial = gain - d(t2, t3)
+            if partial <= 0:
+                break
+            if t3 == t1:
+                continue
+            t4 = tour[(position[t3] - direction) % n]
+            if t4 == t2:
+                continue
+            stats["moves_evaluated"] += 1
+            if (min(t2, t3), max(t2, t3)) in removed:
+                continue
+            if (min(t3, t4), max(t3, t4)) in added:
+                continue
+            found.append((partial + d(t3, t4), t3, t4))
+        found.sort(reverse=True)
+        return found
+
+    def improve_from(t1, direction):
+        t2 = tour[(position[t1] + direction) % n]
+        first_level = candidates(t1, t2, direction, d(t1, t2), set(), set())
+        for first in first_level[:breadth]:
+            gain = d(t1, t2)
+            t2_chain, chain_direction = t2, direction
+            removed = {(min(t1, t2), max(t1, t2))}
+            added = set()
+            applied = []
+            best_gain, best_depth = 1e-9, 0
+            move = first
+
+            for _ in range(max_depth):
+                score, t3, t4 = move
+                applied.append(reverse_path(t2_chain, t4, chain_direction))
+                added.add((min(t2_chain, t3), max(t2_chain, t3)))
+                removed.add((min(t3, t4), max(t3, t4)))
+                gain = score
+                if gain - d(t4, t1) > best_gain:
+                    best_gain, best_depth = gain - d(t4, t1), len(applied)
+                t2_chain = t4
+                chain_direction = 1 if tour[(position[t1] + 1) % n] == t4 else -1
+                deeper = candidates(t1, t2_chain, chain_direction, gain, removed, added)
+                if not deeper:
+                    break
+                move = deeper[0]
+
+            for i, j in reversed(applied[best_depth:]):
+                reverse_segment(tour, position, i, j)
+            if best_depth:
+                touched = set()
+                for i, j in applied[:best_depth]:
+                    touched.update((tour[i], tour[j], tour[i - 1], tour[(j + 1) % n]))
+                return best_gain, touched
+        return 0.0, set()
+
+    deadline = started + time_limit if time_limit is not None else None
+    active = deque(tour)
+    queued = [True] * n
+
+    while active:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        t1 = active.popleft()
+        queued[t1] = False
+        gain, touched = improve_from(t1, 1)
+        if gain <= 0:
+            gain, touched = improve_from(t1, -1)
+        if gain <= 0:
+            continue
+        stats["improvements"] += 1
+        stats["gain"] += gain
+        touched.add(t1)
+        for city in touched:
+            if not queued[city]:
+                queued[city] = True
+                active.append(city)
+
+    tour = np.array(tour, dtype=dtype)
+    stats["time"] = time.perf_counter() - started
+    return tour, instance.tour_length(tour), stats
+
+
+LOCAL_SEARCH = {
+    "2opt": two_opt,
+    "oropt": or_opt,
+    "or2opt": or_2opt,
+    "lk": lin_kernighan,
+}
+
+
+def local_search(instance, tour, method="2opt", time_limit=None):
+    if method not in LOCAL_SEARCH:
+        raise ValueError(
+            f"Unknown local search '{method}', expected one of {sorted(LOCAL_SEARCH)}."
+        )
+    return LOCAL_SEARCH[method](instance, tour, time_limit=time_limit)
+
+
+def double_bridge(tour, rng):
+    n = len(tour)
+    if n < 8:
+        return rng.permutation(tour)
+    a, b, c = np.sort(rng.choice(np.arange(1, n), 3, replace=False))
+    return np.concatenate((tour[:a], tour[c:], tour[b:c], tour[a:b]))
+
+
+class MultiStartLocalSearch:
+    name = "multistart"
+
+    def __init__(
+        self,
+        instance,
+        restarts=20,
+        method="2opt",
+        kick_probability=0.5,
+        termination=None,
+        stats=None,
+        seed=None,
+    ):
+        if len(instance) < 3:
+            raise ValueError("Please add at least 3 cities to run the algorithm.")
+        if method not in LOCAL_SEARCH:
+            raise ValueError(f"Unknown local search '{method}'.")
+        self.instance = instance
+        self.restarts = restarts
+        self.method = method
+        self.kick_probability = kick_probability
+        self.rng = np.random.default_rng(seed)
+        self.termination = termination or Termination()
+        self.termination.start()
+        self.stats = stats or NO_STATS
+
+        self.restart = 0
+        self.best_distances = []
+        self.best_tour = np.array([], dtype=int)
+        self.best_distance = float("inf")
+
+    @property
+    def done(self):
+        return self.restart >= self.restarts or self.termination.reached
+
+    def step(self, time_limit=None):
+        if len(self.best_tour) and self.rng.random() < self.kick_probability:
+            start = double_bridge(self.best_tour, self.rng)
+        else:
+            start = self.rng.permutation(len(self.instance))
+        if time_limit is None:
+            time_limit = self.termination.remaining
+        with self.stats.phase("local_search"):
+            tour, distance, search_stats = local_search(
+                self.instance, start, self.method, time_limit
+            )
+        self.stats.count("local_search_moves", search_stats["moves_evaluated"])
+        if distance < self.best_distance:
+            self.best_tour, self.best_distance = tour, distance
+        self.termination.record(
+            self.best_distance,
+            len(self.instance) + search_stats["moves_evaluated"],
+        )
+        self.best_distances.append(self.best_distance)
+        self.restart += 1
+        return tour, distance
+
+    def best(self):
+        return self.best_tour, self.best_distance
+
+    def adopt(self, tour, distance):
+        if distance < self.best_distance:
+            self.best_tour, self.best_distance = np.array(tour), distance
+
+    def state(self):
+        return {
+            "best_tour": self.best_tour,
+            "best_distance": self.best_distance,
+            "restart": self.restart,
+            "best_distances": self.best_distances,
+            "rng": self.rng.bit_generator.state,
+            "termination": self.termination.state(),
+        }
+
+    def restore(self, state):
+        self.best_tour = state["best_tour"]
+        self.best_distance = state["best_distance"]
+        self.restart = state["restart"]
+        self.best_distances[:] = state["best_distances"]
+        self.rng.bit_generator.state = state["rng"]
+        self.termination.restore(state["termination"])
+
+    def finish(self):
+        return SolveResult(
+            self.instance,
+            self.best_tour,
+            self.best_distance,
+            self.best_distances,
+            self.name,
+            self.termination.reason,
+        )
+
+    def run(self):
+        while not self.done:
+            self.step()
+        return self.finish()
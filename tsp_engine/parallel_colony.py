@@ -0,0 +1,121 @@
+import multiprocessing as mp
+
+import numpy as np
+
+from .colony import AntColony, MaxMinAntSystem, construct_tours
+from .distance import tour_lengths
+from .shared import SharedArray
+
+
+def colony_worker(conn, specs, alpha_val, seed, candidates=None):
+    shared = [SharedArray.attach(spec) for spec in specs]
+    distances, eta_beta, pheromone = (s.array for s in shared)
+    rng = np.random.default_rng(seed)
+    try:
+        while True:
+            num_ants = conn.recv()
+            if num_ants is None:
+                break
+            tours = construct_tours(
+                pheromone, eta_beta, alpha_val, num_ants, rng, candidates=candidates
+            )
+            conn.send((tours, tour_lengths(distances, tours)))
+    finally:
+        del distances, eta_beta, pheromone
+        for s in shared:
+            s.close()
+        conn.close()
+
+
+class ParallelColonyMixin:
+    def __init__(self, instance, num_workers=None, **params):
+        super().__init__(instance, **params)
+        self.num_workers = max(1, min(num_workers or mp.cpu_count(), self.num_ants))
+        self._shared = [
+            SharedArray.create(instance.matrix.values),
+            SharedArray.create(self.eta_beta),
+            SharedArray.create(self.pheromone),
+        ]
+        self.eta_beta = self._shared[1].array
+        self.pheromone = self._shared[2].array
+
+        seeds = np.random.SeedSequence(params.get("seed")).spawn(self.num_workers)
+        specs = [s.spec for s in self._shared]
+        self._connections = []
+        self._workers = []
+        for worker_seed in seeds:
+            parent_conn, child_conn = mp.Pipe()
+            worker = mp.Process(
+                target=colony_worker,
+                args=(child_conn, specs, self.alpha, worker_seed, self.candidates),
+                daemon=True,
+            )
+            worker.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._workers.append(worker)
+
+    def construct(self):
+        with self.stats.phase("construction"):
+            shares = np.diff(
+                np.linspace(0, self.num_ants, self.num_workers + 1).astype(int)
+            )
+            busy = [conn for conn, ants in zip(self._connections, shares) if ants]
+            for conn, ants in zip(self._connections, shares):
+                if ants:
+                    conn.send(int(ants))
+            replies = [conn.recv() for conn in busy]
+            tours = np.concatenate([tours for tours, _ in replies])
+            lengths = np.concatenate([lengths for _, lengths in replies])
+            return tours, lengths
+
+    def state(self):
+        raise ValueError(
+            f"'{self.name}' builds ants in worker processes and cannot be checkpointed."
+        )
+
+    def close(self):
+        for conn in self._connections:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+        for worker in self._workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        self._connections = []
+        self._workers = []
+        if self._shared:
+            self.eta_beta = self.eta_beta.copy()
+            self.pheromone = self.pheromone.copy()
+            for s in self._shared:
+                s.close()
+            self._shared = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def finish(self):
+        self.close()
+        return super().finish()
+
+    def run(self):
+        try:
+            while not self.done:
+                self.step()
+        finally:
+            self.close()
+        return self.finish()
+
+
+class ParallelAntColony(ParallelColonyMixin, AntColony):
+    name = "aco-parallel"
+
+
+class ParallelMaxMinAntSystem(ParallelColonyMixin, MaxMinAntSystem):
+    name = "mmas-parallel"
@@ -0,0 +1,61 @@
+import numpy as np
+
+
+def index_dtype(num_cities):
+    if num_cities <= np.iinfo(np.int16).max + 1:
+        return np.dtype(np.int16)
+    return np.dtype(np.int32)
+
+
+class Population:
+    def __init__(self, size, num_offspring, num_cities, dtype=None):
+        self.size = size
+        self.num_offspring = num_offspring
+        self.num_cities = num_cities
+        self.dtype = np.dtype(dtype) if dtype is not None else index_dtype(num_cities)
+        rows = size + num_offspring
+        self._tours = [np.empty((rows, num_cities), self.dtype) for _ in range(2)]
+        self._fitness = [np.empty(rows) for _ in range(2)]
+        self._active = 0
+
+    @property
+    def tours(self):
+        return self._tours[self._active][: self.size]
+
+    @property
+    def fitness(self):
+        return self._fitness[self._active][: self.size]
+
+    @property
+    def offspring(self):
+        return self._tours[self._active][self.size :]
+
+    @property
+    def offspring_fitness(self):
+        return self._fitness[self._active][self.size :]
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in self._tours) + sum(a.nbytes for a in self._fitness)
+
+    def __len__(self):
+        return self.size
+
+    def best_index(self):
+        return int(np.argmin(self.fitness))
+
+    def best(self):
+        index = self.best_index()
+        return self.tours[index].copy(), float(self.fitness[index])
+
+    def truncate(self):
+        tours = self._tours[self._active]
+        fitness = self._fitness[self._active]
+        survivors = np.argsort(fitness, kind="stable")[: self.size]
+        target = 1 - self._active
+        np.take(tours, survivors, axis=0, out=self._tours[target][: self.size])
+        np.take(fitness, survivors, out=self._fitness[target][: self.size])
+        self._active = target
+
+    def tour_names(self, instance, index):
+        return instance.tour_names(self.tours[index])
@@ -0,0 +1,221 @@
+import multiprocessing as mp
+import time
+
+import numpy as np
+
+from .colony import AntColony, AntColonySystem, MaxMinAntSystem
+from .genetic import GeneticAlgorithm
+from .local_search import MultiStartLocalSearch
+from .population import index_dtype
+from .result import SolveResult
+from .shared import SharedArray
+
+MEMBERS = {
+    "ga": GeneticAlgorithm,
+    "aco": AntColony,
+    "mmas": MaxMinAntSystem,
+    "acs": AntColonySystem,
+    "multistart": MultiStartLocalSearch,
+}
+
+UNLIMITED = {
+    "ga": {"generations": 1 << 62},
+    "aco": {"iterations": 1 << 62},
+    "mmas": {"iterations": 1 << 62},
+    "acs": {"iterations": 1 << 62},
+    "multistart": {"restarts": 1 << 62},
+}
+
+
+class Incumbent:
+    def __init__(self, num_cities):
+        self.tour = SharedArray.create(np.zeros(num_cities, index_dtype(num_cities)))
+        self.distance = mp.Value("d", float("inf"))
+        self.evaluations = mp.Value("q", 0)
+
+    def offer(self, tour, distance, tour_array):
+        with self.distance.get_lock():
+            if distance < self.distance.value:
+                tour_array[:] = tour
+                self.distance.value = distance
+                return True
+        return False
+
+    def charge(self, evaluations):
+        with self.evaluations.get_lock():
+            self.evaluations.value += evaluations
+            return self.evaluations.value
+
+    def read(self, tour_array):
+        with self.distance.get_lock():
+            return tour_array.copy(), self.distance.value
+
+    def close(self):
+        self.tour.close()
+
+
+def portfolio_worker(
+    conn,
+    member,
+    instance,
+    params,
+    seed,
+    incumbent,
+    spec,
+    deadline,
+    budget,
+    target,
+    sync,
+):
+    shared = SharedArray.attach(spec)
+    tour_array = shared.array
+    try:
+        try:
+            solver = MEMBERS[member](
+                instance, seed=seed, **{**UNLIMITED[member], **params}
+            )
+        except (TypeError, ValueError) as e:
+            conn.send((member, ValueError(f"Portfolio member '{member}': {e}")))
+            return
+        charged = 0
+        last_sync = time.monotonic()
+        while time.monotonic() < deadline and not solver.done:
+            if target is not None and incumbent.distance.value <= target:
+                break
+            spent = incumbent.charge(solver.termination.evaluations - charged)
+            charged = solver.termination.evaluations
+            if budget is not None and spent >= budget:
+                break
+            if isinstance(solver, MultiStartLocalSearch):
+                solver.step(time_limit=max(deadline - time.monotonic(), 0.0))
+            else:
+                solver.step()
+            if time.monotonic() - last_sync >= sync:
+                tour, distance = solver.best()
+                if len(tour) and not incumbent.offer(tour, distance, tour_array):
+                    solver.adopt(*incumbent.read(tour_array))
+                last_sync = time.monotonic()
+        incumbent.charge(solver.termination.evaluations - charged)
+        tour, distance = solver.best()
+        if len(tour):
+            incumbent.offer(tour, distance, tour_array)
+        conn.send((member, distance))
+    finally:
+        del tour_array
+        shared.close()
+        conn.close()
+
+
+class Portfolio:
+    name = "portfolio"
+
+    def __init__(
+        self,
+        instance,
+        time_limit=10.0,
+        max_evaluations=None,
+        target_distance=None,
+        members=("ga", "aco", "multistart"),
+        member_params=None,
+        sync_interval=0.5,
+        poll_interval=0.1,
+        seed=None,
+    ):
+        if len(instance) < 3:
+            raise ValueError("Please add at least 3 cities to run the algorithm.")
+        if time_limit is None and max_evaluations is None:
+            raise ValueError("The portfolio needs a time limit or evaluation budget.")
+        unknown = set(members) - set(MEMBERS)
+        if unknown or not members:
+            raise ValueError(
+                f"Unknown portfolio members {sorted(unknown)}, expected {sorted(MEMBERS)}."
+            )
+        self.instance = instance
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self.target_distance = target_distance
+        self.members = list(members)
+        self.member_params = member_params or {}
+        self.sync_interval = sync_interval
+        self.poll_interval = poll_interval
+        self.seed = seed
+        self.best_distances = []
+        self.member_results = {}
+
+    def run(self):
+        instance = self.instance
+        instance.matrix.values
+        incumbent = Incumbent(len(instance))
+        started = time.monotonic()
+        deadline = (
+            started + self.time_limit if self.time_limit is not None else float("inf")
+        )
+        seeds = np.random.SeedSequence(self.seed).spawn(len(self.members))
+        connections, workers = [], []
+        try:
+            for member, member_seed in zip(self.members, seeds):
+                parent_conn, child_conn = mp.Pipe()
+                worker = mp.Process(
+                    target=portfolio_worker,
+                    args=(
+                        child_conn,
+                        member,
+                        instance,
+                        self.member_params.get(member, {}),
+                        member_seed,
+                        incumbent,
+                        incumbent.tour.spec,
+                        deadline,
+                        self.max_evaluations,
+                        self.target_distance,
+                        self.sync_interval,
+                    ),
+                    daemon=True,
+                )
+                worker.start()
+                child_conn.close()
+                connections.append(parent_conn)
+                workers.append(worker)
+
+            pending = list(connections)
+            while pending:
+                ready = mp.connection.wait(pending, timeout=self.poll_interval)
+                for conn in ready:
+                    try:
+                        member, distance = conn.recv()
+                        if isinstance(distance, Exception):
+                            raise distance
+                        self.member_results[member] = distance
+                    except EOFError:
+                        pass
+                    pending.remove(conn)
+                self.best_distances.append(incumbent.distance.value)
+                if time.monotonic() > deadline + max(1.0, self.sync_interval):
+                    break
+            tour, distance = incumbent.read(incumbent.tour.array)
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
+            for conn in connections:
+                conn.close()
+            self.evaluations = incumbent.evaluations.value
+            self.elapsed = time.monotonic() - started
+            incumbent.close()
+
+        if not np.isfinite(distance):
+            raise RuntimeError("No portfolio member produced a tour within the budget.")
+        self.best_distances.append(distance)
+        if self.target_distance is not None and distance <= self.target_distance:
+            stop_reason = "target_distance"
+        elif (
+            self.max_evaluations is not None
+            and self.evaluations >= self.max_evaluations
+        ):
+            stop_reason = "max_evaluations"
+        else:
+            stop_reason = "time_limit"
+        return SolveResult(
+            instance, tour, distance, self.best_distances, self.name, stop_reason
+        )
@@ -0,0 +1,99 @@
+import json
+import time
+
+
+class Phase:
+    __slots__ = ("calls", "seconds", "_started")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self._started = 0.0
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.seconds += time.perf_counter() - self._started
+        self.calls += 1
+
+
+class Stats:
+    enabled = True
+
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+
+    def phase(self, name):
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = Phase()
+        return phase
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def count_tours(self, num_tours, num_cities):
+        self.count("tour_evaluations", num_tours)
+        self.count("distance_evaluations", num_tours * num_cities)
+
+    def to_dict(self):
+        return {
+            "phases": {
+                name: {
+                    "calls": phase.calls,
+                    "seconds": phase.seconds,
+                    "mean_seconds": phase.seconds / phase.calls if phase.calls else 0.0,
+                }
+                for name, phase in sorted(
+                    self.phases.items(), key=lambda item: -item[1].seconds
+                )
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def dump(self, filepath):
+        with open(filepath, "w") as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+    def report(self):
+        stats = self.to_dict()
+        total = sum(phase["seconds"] for phase in stats["phases"].values()) or 1.0
+        lines = [f"{'phase':<18}{'calls':>10}{'seconds':>12}{'share':>8}"]
+        for name, phase in stats["phases"].items():
+            lines.append(
+                f"{name:<18}{phase['calls']:>10}{phase['seconds']:>12.4f}"
+                f"{phase['seconds'] / total:>8.1%}"
+            )
+        for name, value in stats["counters"].items():
+            lines.append(f"{name:<18}{value:>10}")
+        return "\n".join(lines)
+
+
+class NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+class NullStats(Stats):
+    enabled = False
+
+    def phase(self, name):
+        return NULL_PHASE
+
+    def count(self, name, amount=1):
+        pass
+
+    def count_tours(self, num_tours, num_cities):
+        pass
+
+
+NULL_PHASE = NullPhase()
+NO_STATS = NullStats()
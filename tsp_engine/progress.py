@@ -0,0 +1,168 @@
+import json
+import time
+
+import numpy as np
+
+EVENTS = ("iteration", "best_improved", "phase_finished", "run_finished")
+
+
+class Event:
+    __slots__ = ("kind", "step", "elapsed", "data")
+
+    def __init__(self, kind, step, elapsed, **data):
+        self.kind = kind
+        self.step = step
+        self.elapsed = elapsed
+        self.data = data
+
+    def to_dict(self):
+        data = {
+            key: value.tolist() if isinstance(value, np.ndarray) else value
+            for key, value in self.data.items()
+        }
+        return {
+            "event": self.kind,
+            "step": self.step,
+            "elapsed": round(self.elapsed, 6),
+            **data,
+        }
+
+
+class Progress:
+    enabled = True
+
+    def __init__(
+        self,
+        *sinks,
+        events=EVENTS,
+        every=1,
+        interval=0.0,
+        batch_size=64,
+        flush_interval=1.0,
+        include_tours=False,
+    ):
+        unknown = set(events) - set(EVENTS)
+        if unknown:
+            raise ValueError(
+                f"Unknown progress events {sorted(unknown)}, expected {list(EVENTS)}."
+            )
+        if every < 1:
+            raise ValueError("Progress must be reported at least every step.")
+        if interval < 0 or flush_interval < 0:
+            raise ValueError("Progress intervals must not be negative.")
+        if batch_size < 1:
+            raise ValueError("Progress batch size must be at least 1.")
+        self.sinks = list(sinks)
+        self.events = frozenset(events)
+        self.every = every
+        self.interval = interval
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.include_tours = include_tours
+        self.start()
+
+    def subscribe(self, sink):
+        self.sinks.append(sink)
+        return sink
+
+    def start(self):
+        self.started = self._last_flush = self._phase_started = time.monotonic()
+        self._last_iteration = float("-inf")
+        self._buffer = []
+        self.steps = 0
+        self.best_distance = float("inf")
+
+    def emit(self, kind, **data):
+        if kind not in self.events:
+            return
+        now = time.monotonic()
+        self._buffer.append(Event(kind, self.steps, now - self.started, **data))
+        if (
+            len(self._buffer) >= self.batch_size
+            or now - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            events, self._buffer = self._buffer, []
+            for sink in self.sinks:
+                sink(events)
+        self._last_flush = time.monotonic()
+
+    def update(self, solver, current_distance):
+        self.steps += 1
+        best_tour, best_distance = solver.best()
+        if best_distance < self.best_distance:
+            self.best_distance = best_distance
+            if self.include_tours:
+                self.emit(
+                    "best_improved", distance=best_distance, tour=np.array(best_tour)
+                )
+            else:
+                self.emit("best_improved", distance=best_distance)
+
+        if self.steps % self.every == 0 and "iteration" in self.events:
+            now = time.monotonic()
+            if now - self._last_iteration >= self.interval:
+                self._last_iteration = now
+                self.emit(
+                    "iteration",
+                    best_distance=best_distance,
+                    current_distance=current_distance,
+                    evaluations=solver.termination.evaluations,
+                )
+
+    def phase_finished(self, name):
+        now = time.monotonic()
+        self.emit("phase_finished", phase=name, seconds=now - self._phase_started)
+        self._phase_started = now
+
+    def finish(self, result):
+        data = {
+            "algorithm": result.algorithm,
+            "distance": result.distance,
+            "stop_reason": result.stop_reason,
+        }
+        if self.include_tours:
+            data["tour"] = result.tour
+        self.emit("run_finished", **data)
+        self.flush()
+        return result
+
+    def close(self):
+        self.flush()
+        for sink in self.sinks:
+            if hasattr(sink, "close"):
+                sink.close()
+
+
+class NullProgress(Progress):
+    enabled = False
+
+    def __init__(self):
+        super().__init__(events=())
+
+    def update(self, solver, current_distance):
+        pass
+
+    def phase_finished(self, name):
+        pass
+
+    def finish(self, result):
+        return result
+
+
+NO_PROGRESS = NullProgress()
+
+
+class JsonlSink:
+    def __init__(self, filepath):
+        self.file = open(filepath, "w")
+
+    def __call__(self, events):
+        self.file.write("".join(json.dumps(e.to_dict()) + "\n" for e in events))
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
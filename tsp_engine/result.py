@@ -0,0 +1,53 @@
+import numpy as np
+
+
+class SolveResult:
+    def __init__(self, instance, tour, distance, trace, algorithm, stop_reason=None):
+        self.instance = instance
+        self.tour = tour
+        self.distance = distance
+        self.trace = trace
+        self.algorithm = algorithm
+        self.stop_reason = stop_reason
+
+    @property
+    def tour_names(self):
+        return self.instance.tour_names(self.tour)
+
+    def to_dict(self):
+        return {
+            "algorithm": self.algorithm,
+            "tour": self.tour_names,
+            "distance": self.distance,
+            "trace": self.trace,
+            "stop_reason": self.stop_reason,
+        }
+
+
+def save_solution(result, filepath):
+    with open(filepath, "wb") as f:
+        np.savez_compressed(
+            f,
+            tour=np.asarray(result.tour),
+            distance=np.array(result.distance),
+            trace=np.asarray(result.trace, dtype=np.float64),
+            algorithm=np.array(result.algorithm),
+            stop_reason=np.array(result.stop_reason or ""),
+        )
+
+
+def load_solution(filepath, instance):
+    with np.load(filepath) as data:
+        tour = data["tour"]
+        if len(tour) != len(instance):
+            raise ValueError(
+                f"The solution visits {len(tour)} cities, the instance has {len(instance)}."
+            )
+        return SolveResult(
+            instance,
+            tour,
+            float(data["distance"]),
+            data["trace"].tolist(),
+            str(data["algorithm"]),
+            str(data["stop_reason"]) or None,
+        )
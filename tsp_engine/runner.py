@@ -0,0 +1,61 @@
+import queue
+import threading
+
+import numpy as np
+
+from .progress import NO_PROGRESS
+
+
+class SolverThread(threading.Thread):
+    def __init__(self, solver, events=None, progress=None):
+        super().__init__(daemon=True)
+        self.solver = solver
+        self.progress = progress or NO_PROGRESS
+        self.events = events if events is not None else queue.Queue()
+        self._stop_requested = threading.Event()
+
+    def stop(self):
+        self._stop_requested.set()
+
+    @property
+    def stopped(self):
+        return self._stop_requested.is_set()
+
+    def run(self):
+        solver = self.solver
+        progress = self.progress
+        progress.start()
+        steps = 0
+        try:
+            while not solver.done and not self.stopped:
+                _, current_distance = solver.step()
+                progress.update(solver, current_distance)
+                best_tour, best_distance = solver.best()
+                steps += 1
+                self.events.put(
+                    (
+                        "step",
+                        (steps, np.array(best_tour), best_distance, current_distance),
+                    )
+                )
+            progress.phase_finished("search")
+            if not self.stopped:
+                result = solver.finish()
+                progress.phase_finished("finish")
+                self.events.put(("done", progress.finish(result)))
+        except Exception as e:
+            self.events.put(("error", e))
+        finally:
+            progress.flush()
+
+    def poll(self):
+        latest = None
+        while True:
+            try:
+                kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                return latest, None
+            if kind == "step":
+                latest = payload
+            else:
+                return latest, (kind, payload)
@@ -0,0 +1,153 @@
+import numpy as np
+
+GRID_METRICS = ("euclidean", "EUC_2D", "CEIL_2D", "ATT")
+POINTS_PER_CELL = 32
+QUADRANT_POOL = 3
+
+
+def squared_distances(points, candidates):
+    distances = points @ candidates.T
+    distances *= -2.0
+    distances += (points**2).sum(axis=1)[:, None]
+    distances += (candidates**2).sum(axis=1)[None, :]
+    return np.maximum(distances, 0.0, out=distances)
+
+
+def quantile_edges(values, side):
+    ordered = np.sort(values)
+    return np.append(ordered[np.arange(side) * len(ordered) // side], ordered[-1])
+
+
+class GridIndex:
+    def __init__(self, coords, points_per_cell=POINTS_PER_CELL):
+        self.coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        n = len(self.coords)
+        side = max(1, int(np.ceil(np.sqrt(n / points_per_cell))))
+        if n:
+            self.low = self.coords.min(axis=0)
+            # quantile edges keep rows and columns equally full, so outliers
+            # or dense clusters cannot pile most of the points into one cell
+            self.edges = [quantile_edges(self.coords[:, axis], side) for axis in (0, 1)]
+        else:
+            self.low = np.zeros(2)
+            self.edges = [np.zeros(side + 1), np.zeros(side + 1)]
+        self.shape = np.array([side, side], dtype=np.int64)
+
+        cells = self.cell_of(self.coords)
+        keys = cells[:, 0] * self.shape[1] + cells[:, 1]
+        self.order = np.argsort(keys, kind="stable")
+        self.starts = np.searchsorted(
+            keys[self.order], np.arange(self.shape.prod() + 1)
+        )
+
+    def __len__(self):
+        return len(self.coords)
+
+    def cell_of(self, points):
+        return np.stack(
+            [
+                np.searchsorted(edges[1:-1], points[..., axis], side="right")
+                for axis, edges in enumerate(self.edges)
+            ],
+            axis=-1,
+        )
+
+    def members(self, cx, cy, radius=0):
+        y0 = max(cy - radius, 0)
+        y1 = min(cy + radius, self.shape[1] - 1)
+        columns = range(max(cx - radius, 0), min(cx + radius, self.shape[0] - 1) + 1)
+        return np.concatenate(
+            [
+                self.order[
+                    self.starts[x * self.shape[1] + y0] : self.starts[
+                        x * self.shape[1] + y1 + 1
+                    ]
+                ]
+                for x in columns
+            ]
+        )
+
+    def clearance(self, cx, cy, radius):
+        # lower bound on the distance from cell (cx, cy) to any point outside
+        # the block of cells within `radius` of it
+        gap = np.inf
+        for c, edges in ((cx, self.edges[0]), (cy, self.edges[1])):
+            side = len(edges) - 1
+            if c - radius > 0:
+                gap = min(gap, edges[c] - edges[c - radius])
+            if c + radius + 1 < side:
+                gap = min(gap, edges[c + radius + 1] - edges[c + 1])
+        return gap
+
+    def nearest_block(self, points, candidates, k, bound, chunk_size):
+        origin = self.coords[points[0]]
+        rows = max(1, chunk_size // len(candidates))
+        found = []
+        for start in range(0, len(points), rows):
+            chunk = points[start : start + rows]
+            distances = squared_distances(
+                self.coords[chunk] - origin, self.coords[candidates] - origin
+            )
+            distances[chunk[:, None] == candidates[None, :]] = np.inf
+            nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+            reach = np.take_along_axis(distances, nearest, axis=1)
+            if reach.max() > bound:
+                return None
+            order = np.argsort(reach, axis=1, kind="stable")
+            found.append(candidates[np.take_along_axis(nearest, order, axis=1)])
+        return np.concatenate(found)
+
+    def nearest(self, k, chunk_size=1 << 22):
+        n = len(self)
+        k = min(k, n - 1)
+        neighbors = np.empty((n, max(k, 0)), dtype=np.int32)
+        if k <= 0:
+            return neighbors
+
+        for key in np.flatnonzero(np.diff(self.starts)).tolist():
+            cx, cy = divmod(key, int(self.shape[1]))
+            points = self.order[self.starts[key] : self.starts[key + 1]]
+            radius = 1
+            while True:
+                candidates = self.members(cx, cy, radius)
+                if len(candidates) > k:
+                    bound = self.clearance(cx, cy, radius) ** 2
+                    found = self.nearest_block(points, candidates, k, bound, chunk_size)
+                    if found is not None:
+                        neighbors[points] = found
+                        break
+                radius += 1
+        return neighbors
+
+    def nearest_where(self, i, allowed):
+        cx, cy = self.cell_of(self.coords[i])
+        radius = 0
+        while True:
+            candidates = self.members(cx, cy, radius)
+            candidates = candidates[allowed[candidates]]
+            bound = self.clearance(cx, cy, radius) ** 2
+            if len(candidates):
+                distances = squared_distances(
+                    self.coords[i : i + 1] - self.low,
+                    self.coords[candidates] - self.low,
+                )[0]
+                best = int(np.argmin(distances))
+                if distances[best] <= bound:
+                    return int(candidates[best])
+            elif bound == np.inf:
+                return -1
+            radius = max(1, 2 * radius)
+
+    def quadrant_neighbors(self, k, pool=QUADRANT_POOL):
+        near = self.nearest(pool * k)
+        k = min(k, near.shape[1])
+        diff = self.coords[near] - self.coords[:, None, :]
+        quadrant = 2 * (diff[..., 0] >= 0) + (diff[..., 1] >= 0)
+        same = quadrant[..., None] == np.arange(4)
+        rank = np.take_along_axis(
+            np.cumsum(same, axis=1) - 1, quadrant[..., None], axis=2
+        )[..., 0]
+        preferred = rank < max(1, k // 4)
+        key = np.where(preferred, 0, near.shape[1]) + np.arange(near.shape[1])
+        pick = np.argsort(key, axis=1, kind="stable")[:, :k]
+        return np.take_along_axis(near, pick, axis=1)
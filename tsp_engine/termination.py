@@ -0,0 +1,81 @@
+import time
+
+
+class Termination:
+    def __init__(
+        self,
+        time_limit=None,
+        stall_limit=None,
+        target_distance=None,
+        max_evaluations=None,
+    ):
+        if time_limit is not None and time_limit < 0:
+            raise ValueError("Time limit must not be negative.")
+        if stall_limit is not None and stall_limit < 1:
+            raise ValueError("Stall limit must be at least 1 step.")
+        if max_evaluations is not None and max_evaluations < 1:
+            raise ValueError("Maximum evaluations must be at least 1.")
+        self.time_limit = time_limit
+        self.stall_limit = stall_limit
+        self.target_distance = target_distance
+        self.max_evaluations = max_evaluations
+        self.start()
+
+    def start(self):
+        self.started = time.monotonic()
+        self.evaluations = 0
+        self.stalled = 0
+        self.best_distance = float("inf")
+        self.reason = None
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    @property
+    def remaining(self):
+        if self.time_limit is None:
+            return None
+        return max(self.time_limit - self.elapsed, 0.0)
+
+    def state(self):
+        return {
+            "elapsed": self.elapsed,
+            "evaluations": self.evaluations,
+            "stalled": self.stalled,
+            "best_distance": self.best_distance,
+        }
+
+    def restore(self, state):
+        self.started = time.monotonic() - state["elapsed"]
+        self.evaluations = state["evaluations"]
+        self.stalled = state["stalled"]
+        self.best_distance = state["best_distance"]
+        self.reason = None
+
+    def record(self, best_distance, evaluations=0, steps=1):
+        self.evaluations += evaluations
+        if best_distance < self.best_distance:
+            self.best_distance = best_distance
+            self.stalled = 0
+        else:
+            self.stalled += steps
+
+    @property
+    def reached(self):
+        if self.reason is None:
+            if (
+                self.target_distance is not None
+                and self.best_distance <= self.target_distance
+            ):
+                self.reason = "target_distance"
+            elif self.stall_limit is not None and self.stalled >= self.stall_limit:
+                self.reason = "stall_limit"
+            elif (
+                self.max_evaluations is not None
+                and self.evaluations >= self.max_evaluations
+            ):
+                self.reason = "max_evaluations"
+            elif self.time_limit is not None and self.elapsed >= self.time_limit:
+                self.reason = "time_limit"
+        return self.reason is not None
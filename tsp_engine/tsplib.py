@@ -0,0 +1,143 @@
+import itertools
+
+import numpy as np
+
+from .distance import METRICS
+
+SECTIONS = (
+    "NODE_COORD_SECTION",
+    "DISPLAY_DATA_SECTION",
+    "EDGE_WEIGHT_SECTION",
+    "TOUR_SECTION",
+    "FIXED_EDGES_SECTION",
+    "DEMAND_SECTION",
+    "DEPOT_SECTION",
+)
+
+# symmetric matrices only: a column-wise triangle is the other row-wise triangle
+TRIANGLES = {
+    "UPPER_ROW": ("upper", 1),
+    "LOWER_ROW": ("lower", -1),
+    "UPPER_DIAG_ROW": ("upper", 0),
+    "LOWER_DIAG_ROW": ("lower", 0),
+    "UPPER_COL": ("lower", -1),
+    "LOWER_COL": ("upper", 1),
+    "UPPER_DIAG_COL": ("lower", 0),
+    "LOWER_DIAG_COL": ("upper", 0),
+}
+
+
+def read_header(f):
+    header = {}
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        key, _, value = line.partition(":")
+        key = key.strip().upper()
+        if key == "EOF":
+            return header, None
+        if key in SECTIONS:
+            return header, key
+        header[key] = value.strip()
+    return header, None
+
+
+def read_values(f, count):
+    values = np.empty(count)
+    filled = 0
+    for line in f:
+        tokens = line.split()
+        if not tokens:
+            continue
+        take = min(len(tokens), count - filled)
+        values[filled : filled + take] = tokens[:take]
+        filled += take
+        if filled == count:
+            return values
+    raise ValueError(f"Expected {count} values, found {filled}.")
+
+
+def read_coords(f, dimension):
+    rows = np.loadtxt(itertools.islice(f, dimension), ndmin=2)
+    if rows.shape != (dimension, 3):
+        raise ValueError(f"Expected {dimension} node coordinates of the form 'id x y'.")
+    return rows[:, 0].astype(np.int64), rows[:, 1:]
+
+
+def explicit_weights(values, dimension, weight_format):
+    if weight_format == "FULL_MATRIX":
+        return values.reshape(dimension, dimension)
+    if weight_format not in TRIANGLES:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_FORMAT '{weight_format}'.")
+    side, k = TRIANGLES[weight_format]
+    rows, cols = (np.triu_indices if side == "upper" else np.tril_indices)(dimension, k)
+    weights = np.zeros((dimension, dimension))
+    weights[rows, cols] = values
+    weights[cols, rows] = values
+    return weights
+
+
+def weight_count(dimension, weight_format):
+    if weight_format == "FULL_MATRIX":
+        return dimension * dimension
+    if weight_format not in TRIANGLES:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_FORMAT '{weight_format}'.")
+    k = TRIANGLES[weight_format][1]
+    return (
+        dimension * (dimension + 1) // 2 if k == 0 else dimension * (dimension - 1) // 2
+    )
+
+
+def read_tsplib(filepath):
+    with open(filepath, "r") as f:
+        header, section = read_header(f)
+        if header.get("TYPE", "TSP").split()[0] != "TSP":
+            raise ValueError(f"Unsupported TSPLIB problem type '{header['TYPE']}'.")
+        if "DIMENSION" not in header:
+            raise ValueError("TSPLIB file has no DIMENSION.")
+        dimension = int(header["DIMENSION"])
+        metric = header.get("EDGE_WEIGHT_TYPE", "EUC_2D")
+        if metric != "EXPLICIT" and metric not in METRICS:
+            raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE '{metric}'.")
+
+        ids, coords, weights = None, None, None
+        while section is not None:
+            if section in ("NODE_COORD_SECTION", "DISPLAY_DATA_SECTION"):
+                ids, coords = read_coords(f, dimension)
+            elif section == "EDGE_WEIGHT_SECTION":
+                weight_format = header.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX")
+                values = read_values(f, weight_count(dimension, weight_format))
+                weights = explicit_weights(values, dimension, weight_format)
+            else:
+                raise ValueError(f"Unsupported TSPLIB section '{section}'.")
+            _, section = read_header(f)
+
+    if metric == "EXPLICIT" and weights is None:
+        raise ValueError("EXPLICIT instance has no EDGE_WEIGHT_SECTION.")
+    if metric != "EXPLICIT" and coords is None:
+        raise ValueError("TSPLIB file has no NODE_COORD_SECTION.")
+    if coords is None:
+        ids, coords = np.arange(1, dimension + 1), np.zeros((dimension, 2))
+    return {
+        "name": header.get("NAME", ""),
+        "ids": ids,
+        "coords": coords,
+        "metric": metric,
+        "weights": weights,
+    }
+
+
+def read_tour(filepath):
+    with open(filepath, "r") as f:
+        header, section = read_header(f)
+        if section != "TOUR_SECTION":
+            raise ValueError("Tour file has no TOUR_SECTION.")
+        nodes = []
+        for line in f:
+            for token in line.split():
+                node = int(token)
+                if node == -1:
+                    return np.array(nodes, dtype=np.int64)
+                nodes.append(node)
+    return np.array(nodes, dtype=np.int64)